@@ -2,28 +2,73 @@
 
 全専門エージェントで共有するヘルパー関数・定数を定義する。
 """
+import asyncio
 import logging
-from datetime import datetime
-from typing import Callable
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
 
-from dateutil.relativedelta import relativedelta
-from strands import Agent, ToolContext, ModelRetryStrategy
+from strands import Agent, ToolContext
 from strands.agent.conversation_manager import SlidingWindowConversationManager
 
 from handlers.error_handler import LoopLimitError, ErrorHandler
 from handlers.human_approval_hook import HumanApprovalHook
+from handlers.jittered_retry_strategy import JitteredModelRetryStrategy
 from handlers.loop_control_hook import LoopControlHook
 from session.session_manager import SessionManagerFactory
 from config.model_config import ModelConfig
+from models.data_models import calculate_deadline_date
 
 _logger = logging.getLogger(__name__)
 
+# 専門エージェントインスタンスのキャッシュ上限数
+_AGENT_CACHE_MAXSIZE = 64
+
+# 専門エージェントインスタンスのキャッシュ
+# キー: (build_agent, session_id, applicant_name, application_date, deadline)
+# 値: (Agent, 呼び出し直列化用ロック)
+_agent_cache: OrderedDict[tuple, tuple[Agent, threading.Lock]] = OrderedDict()
+_agent_cache_lock = threading.Lock()
+
 # HumanApprovalHookの対象ツール
 _APPROVAL_TARGET_TOOLS = [
     "generate_transportation_expense_form",
     "generate_general_expense_form",
 ]
 
+# エラーログに出力する問い合わせ内容の先頭文字数
+_QUERY_LOG_PREVIEW_CHARS = 50
+
+# 子エージェントに伝播する invocation_state のキー（session_id は除外）
+_FORWARDED_KEYS = ("applicant_name", "application_date")
+
+# HumanApprovalHook はセッション固有の状態を持たないため、全専門エージェントで共有する。
+# LoopControlHook はループカウンターを、SessionManager は agent_id ごとの同期状態を
+# 保持するため、エージェント単位で生成する（生成コストはエージェントキャッシュで償却）。
+_APPROVAL_HOOK = HumanApprovalHook(target_tools=_APPROVAL_TARGET_TOOLS)
+
+
+def build_cached_system_prompt(system_prompt: str, context: str = "") -> list[dict]:
+    """システムプロンプトをキャッシュポイント付きのコンテンツブロックに変換する。
+
+    システムプロンプトの直後にキャッシュポイントを置くことで、同一プロンプトの
+    2ターン目以降は Bedrock 側のプロンプトキャッシュからプレフィックスが提供される。
+    キャッシュはプレフィックス完全一致のため、system_prompt はバイト単位で
+    安定している必要がある。申請者・申請日など呼び出しごとに変わる情報は
+    context としてキャッシュポイントの後ろに置く。
+
+    Args:
+        system_prompt: システムプロンプト文字列（キャッシュ対象）
+        context: キャッシュポイントの後ろに置く可変部分（空文字の場合は付加しない）
+
+    Returns:
+        list[dict]: Agent の system_prompt に渡すコンテンツブロックのリスト
+    """
+    blocks = [{"text": system_prompt}, {"cachePoint": {"type": "default"}}]
+    if context:
+        blocks.append({"text": context})
+    return blocks
+
 
 def calculate_deadline(application_date: str, deadline_months: int) -> str:
     """申請日から申請期限を計算して返す。
@@ -36,9 +81,7 @@ def calculate_deadline(application_date: str, deadline_months: int) -> str:
         str: 申請期限（YYYY-MM-DD形式）。パース失敗時は "要確認"。
     """
     try:
-        app_dt = datetime.strptime(application_date, "%Y-%m-%d")
-        deadline_dt = app_dt - relativedelta(months=deadline_months)
-        return deadline_dt.strftime("%Y-%m-%d")
+        return calculate_deadline_date(application_date, deadline_months)
     except Exception:
         _logger.warning(
             "申請期限の計算に失敗しました。申請期限チェックが無効化されます: "
@@ -49,13 +92,165 @@ def calculate_deadline(application_date: str, deadline_months: int) -> str:
         return "要確認"
 
 
+def get_response_text(response: Any) -> str:
+    """エージェントの応答からテキストを取り出す。
+
+    str(AgentResult) はテキストブロックを逐次連結して新しい文字列を組み立てるため、
+    テキストブロックが1つの場合（通常の応答）はその文字列をそのまま返す。
+    割り込み・構造化出力を含む場合やテキストがない場合は str(response) にフォールバックする。
+
+    Args:
+        response: Agent 呼び出しの戻り値
+
+    Returns:
+        str: 応答テキスト
+    """
+    message = getattr(response, "message", None)
+    if (
+        not isinstance(message, dict)
+        or getattr(response, "interrupts", None)
+        or getattr(response, "structured_output", None)
+    ):
+        return str(response)
+
+    texts = [block["text"] for block in message.get("content", []) if "text" in block]
+    if not texts:
+        return str(response)
+    return texts[0] if len(texts) == 1 else "\n".join(texts)
+
+
+def _estimate_message_chars(message: dict) -> int:
+    """メッセージのテキスト量（文字数）を概算する。
+
+    テキスト・ツール入力・ツール結果のみを数える。日本語主体の会話では
+    1文字≒1トークンとみなし、トークン数の目安として使用する。
+
+    Args:
+        message: 会話履歴のメッセージ
+
+    Returns:
+        int: 概算文字数
+    """
+    total = 0
+    for block in message.get("content", []):
+        if "text" in block:
+            total += len(block["text"])
+        elif "toolUse" in block:
+            total += len(str(block["toolUse"].get("input", "")))
+        elif "toolResult" in block:
+            for item in block["toolResult"].get("content", []):
+                if "text" in item:
+                    total += len(item["text"])
+                elif "json" in item:
+                    total += len(str(item["json"]))
+    return total
+
+
+class CacheFriendlySlidingWindowConversationManager(SlidingWindowConversationManager):
+    """削減を遅延させてプロンプトキャッシュを効かせるスライディングウィンドウ。
+
+    SlidingWindowConversationManager はウィンドウサイズを超えるたびに先頭を削るため、
+    毎ターン履歴のプレフィックスがずれて Bedrock のプロンプトキャッシュが無効になる。
+    本クラスは履歴がウィンドウサイズの2倍を超えるまで削減せず、超えた時点で
+    直近ウィンドウサイズ分まで一度に削減する。削減の間は履歴が末尾への追記のみとなり、
+    前ターンまでのプレフィックスがキャッシュから提供される。
+    """
+
+    def apply_management(self, agent: Agent, **kwargs: Any) -> None:
+        """履歴がウィンドウサイズの2倍を超えた場合のみ直近ウィンドウサイズ分まで削減する。"""
+        if len(agent.messages) <= self.window_size * 2:
+            return
+        self.reduce_context(agent)
+
+
+def _is_turn_start(message: dict) -> bool:
+    """ユーザーターンの開始メッセージ（ツール結果ではないユーザーメッセージ）かを判定する。
+
+    Args:
+        message: 会話履歴のメッセージ
+
+    Returns:
+        bool: ユーザーターンの開始メッセージの場合True
+    """
+    return message.get("role") == "user" and not any(
+        "toolResult" in block for block in message.get("content", [])
+    )
+
+
+class BudgetedSlidingWindowConversationManager(CacheFriendlySlidingWindowConversationManager):
+    """メッセージ数に加えて会話履歴の文字数でも上限を設けるスライディングウィンドウ。
+
+    SlidingWindowConversationManager はメッセージ数でのみ履歴を制限するため、
+    大きなツール結果を含むターンが続くと毎回のプロンプトが肥大化する。
+    メッセージ数による削減の後、概算文字数が上限を超えた場合は上限の半分以下に
+    なるまで古いターンから1ターンずつ削減する。上限ちょうどまでの削減では以降の毎ターンで
+    削減が発生して履歴のプレフィックスがずれ続けるため、余裕を持たせて削減頻度を抑え、
+    削減の間のプロンプトキャッシュを効かせる。
+    直近のユーザーターン（入力とそのツール呼び出し・結果）は収集中の申請情報を含むため、
+    上限を超えていても削減しない。
+    """
+
+    def __init__(self, window_size: int, history_char_budget: int, **kwargs: Any) -> None:
+        """初期化する。
+
+        Args:
+            window_size: 保持するメッセージ数（削減は2倍を超えた時点で行う）
+            history_char_budget: 会話履歴の最大文字数（0以下で文字数による制限を無効化）
+            **kwargs: SlidingWindowConversationManager に渡す追加引数
+        """
+        super().__init__(window_size=window_size, **kwargs)
+        self._history_char_budget = history_char_budget
+
+    def apply_management(self, agent: Agent, **kwargs: Any) -> None:
+        """メッセージ数と文字数の両方の上限に収まるよう会話履歴を削減する。"""
+        super().apply_management(agent, **kwargs)
+        if self._history_char_budget <= 0:
+            return
+
+        messages = agent.messages
+        sizes = [_estimate_message_chars(m) for m in messages]
+        total_chars = sum(sizes)
+        if total_chars <= self._history_char_budget:
+            return
+
+        # 直近のユーザーターンより前のターン境界でのみ削減する
+        # （reduce_context はウィンドウサイズ分まで一度に削るため使わない）
+        latest_turn_start = max(
+            (i for i, m in enumerate(messages) if _is_turn_start(m)), default=0
+        )
+        target_chars = self._history_char_budget // 2
+        cut = 0
+        index = 1
+        while total_chars > target_chars and index <= latest_turn_start:
+            if _is_turn_start(messages[index]):
+                total_chars -= sum(sizes[cut:index])
+                cut = index
+            index += 1
+
+        if cut == 0:
+            return
+        message_count = len(messages)
+        del messages[:cut]
+        self.removed_message_count += cut
+
+        _logger.debug(
+            "会話履歴を文字数上限により削減しました: chars=%d, budget=%d, messages=%d->%d",
+            total_chars,
+            self._history_char_budget,
+            message_count,
+            len(messages),
+        )
+
+
 def create_specialist_agent(
     session_id: str,
     system_prompt: str,
+    system_prompt_context: str,
     tools: list,
     agent_id: str,
     agent_name: str,
     window_size: int,
+    history_char_budget: int,
     max_iterations: int,
     max_attempts: int,
     initial_delay: int,
@@ -63,97 +258,225 @@ def create_specialist_agent(
 ) -> Agent:
     """専門エージェントの共通ファクトリー関数。
 
-    Session/HumanApprovalHook/LoopControlHook の生成と Agent インスタンスの
-    組み立てを共通化する。各専門エージェントのビルド関数はこれを呼び出す。
+    Session/LoopControlHook の生成と Agent インスタンスの組み立てを共通化する。
+    HumanApprovalHook はモジュール共有のインスタンスを使用する。
+    各専門エージェントのビルド関数はこれを呼び出す。
 
     Args:
         session_id: セッションID
-        system_prompt: エージェント固有のシステムプロンプト
+        system_prompt: エージェント固有のシステムプロンプト（全セッション共通部分）
+        system_prompt_context: 申請者名・申請日等のコンテキスト情報（キャッシュポイントの後ろに置く）
         tools: エージェント固有のツールリスト
         agent_id: エージェントの一意識別子（snake_case）
         agent_name: エージェント表示名（日本語、ログ表示用）
-        window_size: SlidingWindowConversationManager のウィンドウサイズ
+        window_size: 会話ウィンドウサイズ（メッセージ数）
+        history_char_budget: 会話履歴の最大文字数（0以下で無効）
         max_iterations: LoopControlHook の最大ループ回数
-        max_attempts: ModelRetryStrategy のリトライ回数
-        initial_delay: ModelRetryStrategy の初期遅延（秒）
-        max_delay: ModelRetryStrategy の最大遅延（秒）
+        max_attempts: JitteredModelRetryStrategy の最大試行回数
+        initial_delay: JitteredModelRetryStrategy の遅延下限（秒）
+        max_delay: JitteredModelRetryStrategy の遅延上限（秒）
 
     Returns:
         Agent: 設定済みの Agent インスタンス
     """
     session_manager = SessionManagerFactory.create(session_id)
-    approval_hook = HumanApprovalHook(target_tools=_APPROVAL_TARGET_TOOLS)
     loop_hook = LoopControlHook(max_iterations=max_iterations, agent_name=agent_name)
 
     return Agent(
         model=ModelConfig.get_model(),
-        system_prompt=system_prompt,
+        system_prompt=build_cached_system_prompt(system_prompt, system_prompt_context),
         callback_handler=None,
         tools=tools,
         agent_id=agent_id,
         name=agent_name,
         description=agent_name,
-        conversation_manager=SlidingWindowConversationManager(
+        conversation_manager=BudgetedSlidingWindowConversationManager(
             window_size=window_size,
+            history_char_budget=history_char_budget,
             should_truncate_results=True,
             per_turn=False,
         ),
-        retry_strategy=ModelRetryStrategy(
+        retry_strategy=JitteredModelRetryStrategy(
             max_attempts=max_attempts,
             initial_delay=initial_delay,
             max_delay=max_delay,
         ),
-        hooks=[approval_hook, loop_hook],
+        hooks=[_APPROVAL_HOOK, loop_hook],
         session_manager=session_manager,
     )
 
 
-def invoke_specialist_agent(
-    query: str,
+def _get_or_build_agent(
+    build_agent: Callable[[str, str, str, str], Agent],
+    session_id: str,
+    applicant_name: str,
+    application_date: str,
+    deadline: str,
+) -> tuple[Agent, threading.Lock]:
+    """キャッシュ済みの専門エージェントを返す。未生成の場合のみ生成する。
+
+    参照・生成ともにロック内で行い、同一キーの Agent が並行して二重生成されないようにする。
+    キャッシュヒット時は最近使用した位置へ移動し、上限を超えた場合は最も長く使われていないものから破棄する。
+
+    Args:
+        build_agent: (session_id, applicant_name, application_date, deadline) -> Agent を返すコールバック
+        session_id: セッションID
+        applicant_name: 申請者名
+        application_date: 申請日（YYYY-MM-DD形式）
+        deadline: 申請期限（YYYY-MM-DD形式）
+
+    Returns:
+        tuple[Agent, threading.Lock]: Agent インスタンスと呼び出し直列化用ロック
+    """
+    key = (build_agent, session_id, applicant_name, application_date, deadline)
+    with _agent_cache_lock:
+        entry = _agent_cache.get(key)
+        if entry is not None:
+            _agent_cache.move_to_end(key)
+            return entry
+
+        entry = (
+            build_agent(session_id, applicant_name, application_date, deadline),
+            threading.Lock(),
+        )
+        _agent_cache[key] = entry
+        if len(_agent_cache) > _AGENT_CACHE_MAXSIZE:
+            _agent_cache.popitem(last=False)
+        return entry
+
+
+def release_specialist_agents(session_id: str) -> int:
+    """指定セッションの専門エージェントをキャッシュから解放する。
+
+    Agent は生成時にセッションマネージャーと結び付くため、別セッションへの再利用はできない。
+    セッションリセット時に旧セッションのインスタンスを即時に解放し、
+    キャッシュ枠を現行セッションに使えるようにする。
+
+    Args:
+        session_id: 解放対象のセッションID
+
+    Returns:
+        int: 解放したエージェント数
+    """
+    with _agent_cache_lock:
+        keys = [key for key in _agent_cache if key[1] == session_id]
+        for key in keys:
+            del _agent_cache[key]
+    return len(keys)
+
+
+def _prepare_specialist_call(
     tool_context: ToolContext,
     agent_id: str,
     deadline_months: int,
     build_agent: Callable[[str, str, str, str], Agent],
-) -> str:
-    """専門エージェントの共通呼び出しラッパー。
+) -> tuple[Agent, threading.Lock, dict]:
+    """専門エージェント呼び出しの前処理を行う。
 
-    invocation_state の取得・deadline 計算・Agent 呼び出し・例外処理を共通化する。
-    各専門エージェントのツール関数はこれを呼び出す。
+    invocation_state の取得・deadline 計算・Agent の取得（キャッシュ）を行う。
 
     Args:
-        query: ユーザーからの入力
         tool_context: Strands SDK が注入する ToolContext
         agent_id: ログ用エージェントID（例: "AG-002"）
         deadline_months: 申請期限の月数（settings.*.deadline_months）
         build_agent: (session_id, applicant_name, application_date, deadline) -> Agent を返すコールバック
 
     Returns:
-        str: エージェントからの応答
+        tuple[Agent, threading.Lock, dict]: Agent・呼び出し直列化用ロック・子エージェント用 invocation_state
     """
-    state = tool_context.invocation_state
-    applicant_name = state.get("applicant_name", "")
-    application_date = state.get("application_date", "")
+    state = getattr(tool_context, "invocation_state", None) or {}
+    # SDK が呼び出し中に invocation_state へキーを追加するため、呼び出しごとに新しい辞書を渡す
+    child_invocation_state = {key: state.get(key, "") for key in _FORWARDED_KEYS}
+    applicant_name = child_invocation_state["applicant_name"]
+    application_date = child_invocation_state["application_date"]
     session_id = state.get("session_id", "")
 
     _logger.info("%s エージェントを開始します: session_id=%s", agent_id, session_id)
 
     deadline = calculate_deadline(application_date, deadline_months)
 
-    agent = build_agent(session_id, applicant_name, application_date, deadline)
+    agent, agent_lock = _get_or_build_agent(
+        build_agent, session_id, applicant_name, application_date, deadline
+    )
+    return agent, agent_lock, child_invocation_state
+
 
-    # session_id は除外して子エージェントに伝播
-    child_invocation_state = {
-        "applicant_name": applicant_name,
-        "application_date": application_date,
-    }
+async def _acquire_agent_lock(agent_lock: threading.Lock) -> None:
+    """イベントループを止めずに Agent の呼び出し直列化用ロックを取得する。
+
+    取得できない場合はスレッドで待機する。待機中に呼び出し元がキャンセルされても
+    待機スレッドは止められないため、キャンセル後に取得したロックはスレッド側で直ちに解放する。
+
+    Args:
+        agent_lock: 呼び出し直列化用ロック
+    """
+    if agent_lock.acquire(blocking=False):
+        return
+
+    guard = threading.Lock()
+    abandoned = False
+    acquired = False
+
+    def wait_and_acquire() -> None:
+        nonlocal acquired
+        agent_lock.acquire()
+        with guard:
+            if abandoned:
+                agent_lock.release()
+            else:
+                acquired = True
+
+    try:
+        await asyncio.to_thread(wait_and_acquire)
+    except asyncio.CancelledError:
+        with guard:
+            abandoned = True
+            if acquired:
+                agent_lock.release()
+        raise
+
+
+async def invoke_specialist_agent_async(
+    query: str,
+    tool_context: ToolContext,
+    agent_id: str,
+    deadline_months: int,
+    build_agent: Callable[[str, str, str, str], Agent],
+) -> str:
+    """専門エージェントの共通呼び出しラッパー。
+
+    invocation_state の取得・deadline 計算・Agent 呼び出し・例外処理を共通化する。
+    各専門エージェントのツール関数はこれを呼び出す。
+    Agent は同一セッション・同一申請者情報の間キャッシュして再利用する。
+    Agent.invoke_async で呼び出し、モデル応答の待機中にイベントループを占有しないため、
+    オーケストレーターが同一ターンで複数の専門エージェントを呼び出した場合に待ち時間が重なり合う。
+
+    Args:
+        query: ユーザーからの入力
+        tool_context: Strands SDK が注入する ToolContext
+        agent_id: ログ用エージェントID（例: "AG-002"）
+        deadline_months: 申請期限の月数（settings.*.deadline_months）
+        build_agent: (session_id, applicant_name, application_date, deadline) -> Agent を返すコールバック
+
+    Returns:
+        str: エージェントからの応答
+    """
+    agent, agent_lock, child_invocation_state = _prepare_specialist_call(
+        tool_context, agent_id, deadline_months, build_agent
+    )
 
     try:
-        response = agent(query, invocation_state=child_invocation_state)
+        # 同一 Agent への並行呼び出しは SDK が拒否するため直列化する
+        await _acquire_agent_lock(agent_lock)
+        try:
+            response = await agent.invoke_async(query, invocation_state=child_invocation_state)
+        finally:
+            agent_lock.release()
         _logger.info("%s エージェントが完了しました", agent_id)
-        return str(response)
+        return get_response_text(response)
     except LoopLimitError as e:
-        _logger.warning("LoopLimitError: agent_id=%s, query=%s", agent_id, query[:50])
+        _logger.warning("LoopLimitError: agent_id=%s, query=%s", agent_id, query[:_QUERY_LOG_PREVIEW_CHARS])
         return ErrorHandler.handle_loop_limit_error(e)
     except Exception as e:
-        _logger.error("予期しないエラー: agent_id=%s, query=%s", agent_id, query[:50], exc_info=True)
+        _logger.error("予期しないエラー: agent_id=%s, query=%s", agent_id, query[:_QUERY_LOG_PREVIEW_CHARS], exc_info=True)
         return ErrorHandler.handle_unexpected_error(e)
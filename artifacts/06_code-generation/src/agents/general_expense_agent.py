@@ -7,13 +7,22 @@ import logging
 
 from strands import Agent, tool, ToolContext
 
-from agents.base_agent import create_specialist_agent, invoke_specialist_agent
+from agents.base_agent import create_specialist_agent, invoke_specialist_agent_async
 from config.settings import settings
-from prompt.prompt_general_expense import get_general_expense_system_prompt
+from prompt.prompt_general_expense import (
+    get_general_expense_context_prompt,
+    get_general_expense_system_prompt,
+)
+from tools.rule_check_tools import check_general_expense_rules
 from tools.output_generator import generate_general_expense_form
 
 _logger = logging.getLogger(__name__)
 
+# エージェント生成ごとに変わらない構成値
+_AGENT_ID = "general_expense_agent"
+_AGENT_NAME = "経費精算申請エージェント"
+_TOOLS = [check_general_expense_rules, generate_general_expense_form]
+
 
 def _build_general_expense_agent(
     session_id: str,
@@ -33,18 +42,20 @@ def _build_general_expense_agent(
         構成済みのAgentインスタンス
     """
     cfg = settings.general_expense
-    system_prompt = get_general_expense_system_prompt(
+    system_prompt_context = get_general_expense_context_prompt(
         applicant_name=applicant_name,
         application_date=application_date,
         deadline=deadline,
     )
     return create_specialist_agent(
         session_id=session_id,
-        system_prompt=system_prompt,
-        tools=[generate_general_expense_form],
-        agent_id="general_expense_agent",
-        agent_name="経費精算申請エージェント",
+        system_prompt=get_general_expense_system_prompt(),
+        system_prompt_context=system_prompt_context,
+        tools=_TOOLS,
+        agent_id=_AGENT_ID,
+        agent_name=_AGENT_NAME,
         window_size=cfg.window_size,
+        history_char_budget=cfg.history_char_budget,
         max_iterations=cfg.max_iterations,
         max_attempts=cfg.max_attempts,
         initial_delay=cfg.initial_delay,
@@ -53,7 +64,7 @@ def _build_general_expense_agent(
 
 
 @tool(context=True)
-def general_expense_agent(query: str, tool_context: ToolContext) -> str:
+async def general_expense_agent(query: str, tool_context: ToolContext) -> str:
     """一般経費精算申請の情報収集・領収書解析・カテゴリ判定・期限チェック・申請書生成を行う。
 
     Args:
@@ -62,7 +73,7 @@ def general_expense_agent(query: str, tool_context: ToolContext) -> str:
     Returns:
         str: エージェントからの応答
     """
-    return invoke_specialist_agent(
+    return await invoke_specialist_agent_async(
         query=query,
         tool_context=tool_context,
         agent_id="AG-003",
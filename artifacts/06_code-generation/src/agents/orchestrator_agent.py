@@ -4,16 +4,25 @@
 適切な専門エージェントへルーティングするオーケストレーター。
 """
 import logging
-from datetime import datetime
+import sys
+import threading
+from typing import Any, Optional
+from datetime import date
 
-from strands import Agent, ModelRetryStrategy
-from strands.agent.conversation_manager import SlidingWindowConversationManager
+from strands import Agent
+from strands.hooks import BeforeModelCallEvent
+from strands.tools.executors import ConcurrentToolExecutor, SequentialToolExecutor
 
-from agents.transportation_expense_agent import transportation_expense_agent
-from agents.general_expense_agent import general_expense_agent
+from agents.base_agent import (
+    CacheFriendlySlidingWindowConversationManager,
+    build_cached_system_prompt,
+    get_response_text,
+    release_specialist_agents,
+)
 from config.model_config import ModelConfig
 from config.settings import settings
 from handlers.error_handler import ErrorHandler, LoopLimitError
+from handlers.jittered_retry_strategy import JitteredModelRetryStrategy
 from models.data_models import InvocationState
 from handlers.loop_control_hook import LoopControlHook
 from prompt.prompt_orchestrator import ORCHESTRATOR_SYSTEM_PROMPT
@@ -21,6 +30,26 @@ from session.session_manager import SessionManagerFactory
 
 _logger = logging.getLogger(__name__)
 
+# 終了・リセットコマンド（小文字化した入力と照合する）
+_EXIT_COMMANDS = frozenset({"exit", "quit", "終了"})
+_RESET_COMMANDS = frozenset({"reset", "リセット", "最初から"})
+
+# 起動時バナー（1回の書き込みで表示する）
+_BANNER = (
+    "============================================================\n"
+    "こちらは申請受付窓口エージェントです\n"
+    "社内の様々な申請作業をサポートします\n"
+    "\n"
+    "申請したい内容をお知らせください。キーワードでも構いません\n"
+    "\n"
+    "※終了するには 'exit' または 'quit' と入力ください\n"
+    "※最初からやり直すには 'reset' と入力ください\n"
+    "============================================================\n"
+)
+
+# キャッシュポイント付きのシステムプロンプト（定数のためインポート時に一度だけ組み立てる）
+_SYSTEM_PROMPT_BLOCKS = build_cached_system_prompt(ORCHESTRATOR_SYSTEM_PROMPT)
+
 
 class OrchestratorAgent:
     """申請受付窓口エージェント
@@ -38,6 +67,19 @@ class OrchestratorAgent:
         self._applicant_name = applicant_name
         self._session_id = SessionManagerFactory.generate_session_id()
         self._session_manager = SessionManagerFactory.create(self._session_id)
+        # 検証済み invocation_state とその申請日（日付が変わるまで文字列化・再検証しない）
+        self._invocation_state: dict = {}
+        self._invocation_state_date: Optional[date] = None
+        # 応答テキストを逐次表示するか、および現在のターンで表示済みか
+        self._stream_response = settings.orchestrator.stream_response
+        self._streamed = False
+        # 現在のモデル呼び出しで応答テキストを表示済みか（表示済みの呼び出しはリトライしない）
+        self._model_call_streamed = False
+        # ループカウンターは呼び出し開始ごとに初期化されるため、セッションリセット後も再利用する
+        self._loop_control_hook = LoopControlHook(
+            max_iterations=settings.orchestrator.max_iterations,
+            agent_name="申請受付窓口エージェント",
+        )
         self._agent = self._initialize_agent()
         _logger.info(
             "セッション開始: session_id=%s, applicant_name=%s",
@@ -50,45 +92,53 @@ class OrchestratorAgent:
         Returns:
             Agent: 設定済みのAgentインスタンス
         """
+        # 専門エージェント（プロンプト・ポリシー・ツール群）の読み込みは初回生成時まで遅延させる
+        from agents.general_expense_agent import general_expense_agent
+        from agents.transportation_expense_agent import transportation_expense_agent
+
         cfg = settings.orchestrator
-        loop_control_hook = LoopControlHook(
-            max_iterations=cfg.max_iterations,
-            agent_name="申請受付窓口エージェント",
-        )
 
-        return Agent(
+        agent = Agent(
             model=ModelConfig.get_model(),
-            system_prompt=ORCHESTRATOR_SYSTEM_PROMPT,
+            system_prompt=_SYSTEM_PROMPT_BLOCKS,
             tools=[transportation_expense_agent, general_expense_agent],
             agent_id="orchestrator_agent",
             name="申請受付窓口エージェント",
             description="社員の申請内容を受け付け、申請種別を判断し、適切な専門エージェントへルーティングする受付窓口",
-            conversation_manager=SlidingWindowConversationManager(
+            conversation_manager=CacheFriendlySlidingWindowConversationManager(
                 window_size=cfg.window_size,
                 should_truncate_results=True,
                 per_turn=False,
             ),
-            callback_handler=None,
-            retry_strategy=ModelRetryStrategy(
+            callback_handler=self._print_text_delta if self._stream_response else None,
+            # 同一ターンで複数の専門エージェントが呼ばれた場合、並行実行で待ち時間を最も遅い1件に抑える
+            tool_executor=(
+                ConcurrentToolExecutor()
+                if cfg.parallel_tool_execution
+                else SequentialToolExecutor()
+            ),
+            retry_strategy=JitteredModelRetryStrategy(
                 max_attempts=cfg.max_attempts,
                 initial_delay=cfg.initial_delay,
                 max_delay=cfg.max_delay,
+                # 途中応答を表示済みの呼び出しを再試行すると同じ応答が重複して表示されるため
+                partial_output_emitted=self._has_streamed_model_output,
             ),
-            hooks=[loop_control_hook],
+            hooks=[self._loop_control_hook],
             session_manager=self._session_manager,
         )
+        agent.hooks.add_callback(BeforeModelCallEvent, self._reset_model_call_stream)
+        return agent
 
     def run(self) -> None:
         """対話ループのメイン処理。"""
-        print("============================================================")
-        print("こちらは申請受付窓口エージェントです")
-        print("社内の様々な申請作業をサポートします")
-        print("")
-        print("申請したい内容をお知らせください。キーワードでも構いません")
-        print("")
-        print("※終了するには 'exit' または 'quit' と入力ください")
-        print("※最初からやり直すには 'reset' と入力ください")
-        print("============================================================")
+        sys.stdout.write(_BANNER)
+        sys.stdout.flush()
+
+        from tools.transportation_tools import preload_fare_data
+
+        # ユーザーが入力している間に運賃データを読み込んでおく
+        threading.Thread(target=preload_fare_data, name="fare-data-preload", daemon=True).start()
 
         while True:
             try:
@@ -118,77 +168,134 @@ class OrchestratorAgent:
         Returns:
             bool: 対話を継続する場合True、終了する場合False
         """
+        command = user_input.lower()
+
         # 終了コマンド判定
-        if user_input.lower() in ("exit", "quit", "終了"):
+        if command in _EXIT_COMMANDS:
             print("\nセッションを終了します。お疲れ様でした。")
             return False
 
         # リセットコマンド判定
-        if user_input.lower() in ("reset", "リセット", "最初から"):
+        if command in _RESET_COMMANDS:
             self._reset_session()
             print("\nセッションをリセットしました。最初からやり直します。")
             print("申請内容を入力してください。")
             return True
 
         # 通常入力: エージェント実行
-        response = self._execute_agent(user_input)
-        print(f"\nシステム> {response}")
+        if not self._stream_response:
+            _, response = self._execute_agent(user_input)
+            print(f"\nシステム> {response}")
+            return True
+
+        # ストリーミング時は生成されたテキストを逐次表示し、正常終了して表示済みの場合のみ戻り値を省く。
+        # エラー時は途中までストリーミングされていても、改行してエラーメッセージを表示する
+        print("\nシステム> ", end="", flush=True)
+        self._streamed = False
+        succeeded, response = self._execute_agent(user_input)
+        if succeeded and self._streamed:
+            print("")
+        elif self._streamed:
+            print(f"\n{response}")
+        else:
+            print(response)
         return True
 
-    def _execute_agent(self, user_input: str) -> str:
+    def _print_text_delta(self, **kwargs: Any) -> None:
+        """モデルが生成したテキスト差分を標準出力へ逐次書き出すコールバック。
+
+        Args:
+            **kwargs: Strands SDK のストリーミングイベント（テキスト差分は "data" キー）
+        """
+        data = kwargs.get("data")
+        if data:
+            sys.stdout.write(data)
+            sys.stdout.flush()
+            self._streamed = True
+            self._model_call_streamed = True
+
+    def _reset_model_call_stream(self, event: BeforeModelCallEvent) -> None:
+        """モデル呼び出しの開始時に、呼び出し単位の表示済みフラグを初期化する。"""
+        self._model_call_streamed = False
+
+    def _has_streamed_model_output(self) -> bool:
+        """現在のモデル呼び出しで応答テキストを表示済みかを返す。"""
+        return self._model_call_streamed
+
+    def _execute_agent(self, user_input: str) -> tuple[bool, str]:
         """エージェントを実行し応答を取得する。
 
         Args:
             user_input: ユーザーからの入力テキスト
 
         Returns:
-            str: エージェントの応答テキスト
+            tuple[bool, str]: (正常終了したか, 応答テキスト。例外時はユーザー向けエラーメッセージ)
         """
-        invocation_state = InvocationState(
-            applicant_name=self._applicant_name,
-            application_date=datetime.now().strftime("%Y-%m-%d"),
-            session_id=self._session_id,
-        )
+        invocation_state = self._get_invocation_state()
 
         try:
             response = self._agent(
                 user_input,
-                invocation_state=invocation_state.model_dump(),
+                invocation_state=invocation_state,
             )
-            return str(response)
+            return True, get_response_text(response)
 
         except KeyboardInterrupt as e:
             _logger.info(
                 "KeyboardInterruptが発生しました: session_id=%s", self._session_id,
             )
-            return ErrorHandler.handle_keyboard_interrupt(e)
+            return False, ErrorHandler.handle_keyboard_interrupt(e)
 
         except LoopLimitError as e:
             _logger.warning(
                 "LoopLimitErrorが発生しました: session_id=%s", self._session_id,
             )
-            return ErrorHandler.handle_loop_limit_error(e)
+            return False, ErrorHandler.handle_loop_limit_error(e)
 
         except RuntimeError as e:
             _logger.error(
                 "RuntimeErrorが発生しました: session_id=%s", self._session_id,
                 exc_info=True,
             )
-            return ErrorHandler.handle_runtime_error(e)
+            return False, ErrorHandler.handle_runtime_error(e)
 
         except Exception as e:
             _logger.error(
                 "予期しないエラーが発生しました: session_id=%s", self._session_id,
                 exc_info=True,
             )
-            return ErrorHandler.handle_unexpected_error(e)
+            return False, ErrorHandler.handle_unexpected_error(e)
+
+    def _get_invocation_state(self) -> dict:
+        """子エージェントへ渡す invocation_state を取得する。
+
+        申請者名・セッションIDはセッション中に変わらないため、Pydantic による検証は
+        セッション開始時と申請日（日付）が変わった時のみ行う。
+        SDK が呼び出し中に辞書へキーを追加するため、毎ターン浅いコピーを返す。
+
+        Returns:
+            dict: 検証済みの invocation_state のコピー
+        """
+        today = date.today()
+        if today != self._invocation_state_date:
+            self._invocation_state = InvocationState(
+                applicant_name=self._applicant_name,
+                application_date=today.isoformat(),
+                session_id=self._session_id,
+            ).model_dump()
+            self._invocation_state_date = today
+        return dict(self._invocation_state)
 
     def _reset_session(self) -> None:
         """セッションをリセットし、新しいセッションで再初期化する。"""
         old_session_id = self._session_id
+        released = release_specialist_agents(old_session_id)
         self._session_id = SessionManagerFactory.generate_session_id()
         self._session_manager = SessionManagerFactory.create(self._session_id)
+        self._invocation_state = {}
+        self._invocation_state_date = None
         self._agent = self._initialize_agent()
         _logger.info(
-            "セッションリセット: old=%s, new=%s", old_session_id, self._session_id,
+            "セッションリセット: old=%s, new=%s, released_agents=%d",
+            old_session_id, self._session_id, released,
         )
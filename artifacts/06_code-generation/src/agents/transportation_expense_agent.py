@@ -8,14 +8,28 @@ import logging
 
 from strands import Agent, tool, ToolContext
 
-from agents.base_agent import create_specialist_agent, invoke_specialist_agent
+from agents.base_agent import create_specialist_agent, invoke_specialist_agent_async
 from config.settings import settings
-from prompt.prompt_transportation_expense import get_transportation_expense_system_prompt
-from tools.transportation_tools import calculate_transportation_cost
+from prompt.prompt_transportation_expense import (
+    get_transportation_expense_context_prompt,
+    get_transportation_expense_system_prompt,
+)
+from tools.transportation_tools import calculate_transportation_cost, calculate_transportation_costs
+from tools.rule_check_tools import check_transportation_expense_rules
 from tools.output_generator import generate_transportation_expense_form
 
 _logger = logging.getLogger(__name__)
 
+# エージェント生成ごとに変わらない構成値
+_AGENT_ID = "transportation_expense_agent"
+_AGENT_NAME = "交通費精算申請エージェント"
+_TOOLS = [
+    calculate_transportation_cost,
+    calculate_transportation_costs,
+    check_transportation_expense_rules,
+    generate_transportation_expense_form,
+]
+
 
 def _build_transportation_expense_agent(
     session_id: str,
@@ -35,18 +49,20 @@ def _build_transportation_expense_agent(
         構成済みのAgentインスタンス
     """
     cfg = settings.transportation_expense
-    system_prompt = get_transportation_expense_system_prompt(
+    system_prompt_context = get_transportation_expense_context_prompt(
         applicant_name=applicant_name,
         application_date=application_date,
         deadline=deadline,
     )
     return create_specialist_agent(
         session_id=session_id,
-        system_prompt=system_prompt,
-        tools=[calculate_transportation_cost, generate_transportation_expense_form],
-        agent_id="transportation_expense_agent",
-        agent_name="交通費精算申請エージェント",
+        system_prompt=get_transportation_expense_system_prompt(),
+        system_prompt_context=system_prompt_context,
+        tools=_TOOLS,
+        agent_id=_AGENT_ID,
+        agent_name=_AGENT_NAME,
         window_size=cfg.window_size,
+        history_char_budget=cfg.history_char_budget,
         max_iterations=cfg.max_iterations,
         max_attempts=cfg.max_attempts,
         initial_delay=cfg.initial_delay,
@@ -55,7 +71,7 @@ def _build_transportation_expense_agent(
 
 
 @tool(context=True)
-def transportation_expense_agent(query: str, tool_context: ToolContext) -> str:
+async def transportation_expense_agent(query: str, tool_context: ToolContext) -> str:
     """交通費精算申請を処理する専門エージェント。
 
     ユーザーとの対話を通じて交通費精算に必要な情報を収集し、
@@ -67,7 +83,7 @@ def transportation_expense_agent(query: str, tool_context: ToolContext) -> str:
     Returns:
         str: エージェントからの応答
     """
-    return invoke_specialist_agent(
+    return await invoke_specialist_agent_async(
         query=query,
         tool_context=tool_context,
         agent_id="AG-002",
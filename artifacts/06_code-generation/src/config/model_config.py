@@ -7,7 +7,8 @@ import logging
 import os
 from functools import lru_cache
 
-from strands.models import BedrockModel
+from botocore.config import Config
+from strands.models import BedrockModel, CacheConfig
 
 _logger = logging.getLogger(__name__)
 
@@ -18,16 +19,27 @@ class ModelConfig:
     # モデルID
     DEFAULT_MODEL_ID = "jp.anthropic.claude-sonnet-4-5-20250929-v1:0"
 
+    # bedrock-runtime クライアントの同時接続数の既定値（並行実行される専門エージェントの呼び出しで共有する）
+    # 環境変数 BEDROCK_MAX_POOL_CONNECTIONS で上書きできる
+    MAX_POOL_CONNECTIONS = 16
+
     @classmethod
     @lru_cache(maxsize=1)
     def get_model(cls) -> BedrockModel:
         """BedrockModelインスタンスを取得する。
 
+        全エージェントがこのインスタンスを共有するため、bedrock-runtime クライアントと
+        その接続プールもプロセス内で1つとなる。リトライはエージェント側のリトライ戦略で
+        行うため、boto3 側のリトライは無効化する。
+        プロンプトキャッシュはシステムプロンプト（各エージェントが明示的に配置）に加え、
+        ツール定義と会話履歴の末尾にも自動でキャッシュポイントを挿入する。
+
         Returns:
             BedrockModel: 設定済みのBedrockModelインスタンス
         """
         guardrail_id = os.getenv("GUARDRAIL_ID")
         guardrail_version = os.getenv("GUARDRAIL_VERSION", "DRAFT")
+        max_pool_connections = cls._get_max_pool_connections()
 
         if not guardrail_id:
             _logger.warning("GUARDRAIL_ID が未設定です。ガードレールなしで動作します。")
@@ -38,4 +50,35 @@ class ModelConfig:
             guardrail_id=guardrail_id,
             guardrail_version=guardrail_version,
             guardrail_trace="enabled",
+            cache_config=CacheConfig(strategy="auto", tools_ttl=True),
+            boto_client_config=Config(
+                max_pool_connections=max_pool_connections,
+                tcp_keepalive=True,
+                retries={"mode": "standard", "total_max_attempts": 1},
+            ),
         )
+
+    @classmethod
+    def _get_max_pool_connections(cls) -> int:
+        """bedrock-runtime クライアントの同時接続数を取得する。
+
+        環境変数 BEDROCK_MAX_POOL_CONNECTIONS が未設定・数値以外・1未満の場合は
+        既定値（MAX_POOL_CONNECTIONS）を使用する。
+
+        Returns:
+            int: 同時接続数
+        """
+        value = os.getenv("BEDROCK_MAX_POOL_CONNECTIONS")
+        if not value:
+            return cls.MAX_POOL_CONNECTIONS
+        try:
+            max_pool_connections = int(value)
+        except ValueError:
+            max_pool_connections = 0
+        if max_pool_connections < 1:
+            _logger.warning(
+                "BEDROCK_MAX_POOL_CONNECTIONS が不正です。既定値を使用します: value=%r, default=%d",
+                value, cls.MAX_POOL_CONNECTIONS,
+            )
+            return cls.MAX_POOL_CONNECTIONS
+        return max_pool_connections
@@ -14,9 +14,9 @@ from pydantic_settings import BaseSettings
 class _AgentSettings(BaseSettings):
     """全エージェント共通パラメータ"""
     max_iterations: int = Field(10, description="ReActループ最大回数")
-    max_attempts: int = Field(6, description="モデル呼び出しリトライ回数")
-    initial_delay: int = Field(4, description="リトライ初期遅延（秒）")
-    max_delay: int = Field(240, description="リトライ最大遅延（秒）")
+    max_attempts: int = Field(4, description="モデル呼び出しリトライ回数")
+    initial_delay: int = Field(2, description="リトライ初期遅延（秒）")
+    max_delay: int = Field(30, description="リトライ最大遅延（秒）")
 
 
 class OrchestratorSettings(_AgentSettings):
@@ -26,6 +26,8 @@ class OrchestratorSettings(_AgentSettings):
     例: ECAAS_ORCHESTRATOR_MAX_ITERATIONS=15
     """
     window_size: int = Field(30, description="会話ウィンドウサイズ（ターン数）")
+    parallel_tool_execution: bool = Field(True, description="同一ターン内の複数ツール呼び出しを並行実行するか")
+    stream_response: bool = Field(True, description="応答テキストを生成と同時に逐次表示するか")
 
     model_config = {"env_prefix": "ECAAS_ORCHESTRATOR_", "extra": "ignore"}
 
@@ -37,6 +39,7 @@ class TransportationExpenseSettings(_AgentSettings):
     例: ECAAS_TRANSPORTATION_EXPENSE_MAX_ITERATIONS=15
     """
     window_size: int = Field(20, description="会話ウィンドウサイズ（ターン数）")
+    history_char_budget: int = Field(8000, description="会話履歴の最大文字数（0で無効）")
     deadline_months: int = Field(3, description="申請期限（経費発生日からの月数）")
     approval_threshold: int = Field(10000, description="上長承認閾値（円）")
 
@@ -50,6 +53,7 @@ class GeneralExpenseSettings(_AgentSettings):
     例: ECAAS_GENERAL_EXPENSE_MAX_ITERATIONS=15
     """
     window_size: int = Field(15, description="会話ウィンドウサイズ（ターン数）")
+    history_char_budget: int = Field(8000, description="会話履歴の最大文字数（0で無効）")
     deadline_months: int = Field(3, description="申請期限（経費発生日からの月数）")
     approval_threshold: int = Field(5000, description="上長承認閾値（円）")
 
@@ -112,13 +112,11 @@ class ErrorHandler:
         Returns:
             str: ユーザー向け日本語エラーメッセージ
         """
-        field_errors = []
-        for err in error.errors():
-            loc = ".".join(str(part) for part in err["loc"])
-            msg = err["msg"]
-            field_errors.append(f"- {loc}: {msg}")
-
-        error_details = "\n".join(field_errors)
+        # メッセージに使わない入力値・ドキュメントURLは取得しない
+        error_details = "\n".join(
+            f"- {'.'.join(map(str, err['loc']))}: {err['msg']}"
+            for err in error.errors(include_url=False, include_input=False)
+        )
         return f"入力データに不備があります。以下の項目を確認してください。\n{error_details}"
 
     @staticmethod
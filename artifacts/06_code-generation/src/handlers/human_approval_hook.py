@@ -4,12 +4,27 @@
 修正要望があれば修正を実行するフック。
 """
 import logging
+import sys
 from typing import Any, Callable, Optional
 
 from strands.hooks import HookProvider, HookRegistry, BeforeToolCallEvent
 
 _logger = logging.getLogger(__name__)
 
+# 承認プロンプトで受け付ける選択肢（[1] OK / [2] 修正 / [3] キャンセル）
+_VALID_CHOICES = frozenset({"1", "2", "3"})
+
+# 承認プロンプト（1回の書き込みで表示する）
+_APPROVAL_PROMPT = (
+    "\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    "📝 申請書を生成します。よろしいですか？\n"
+    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    "[1] OK（申請書を生成する）\n"
+    "[2] 修正（内容を修正する）\n"
+    "[3] キャンセル（申請を中止する）\n"
+    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+)
+
 
 class HumanApprovalHook(HookProvider):
     """指定ツール実行前に人間の承認を求めるフック。
@@ -30,7 +45,8 @@ class HumanApprovalHook(HookProvider):
                 シグネチャ: (tool_name: str, tool_params: dict) -> tuple[bool, str]
                 戻り値: (True, "") → OK、(False, "修正内容") → 修正要望、(False, "CANCEL") → キャンセル
         """
-        self._target_tools = target_tools
+        # 全ツール呼び出しで照合するため、ハッシュで判定できる frozenset として保持する
+        self._target_tools = frozenset(target_tools)
         self._approval_callback = approval_callback
 
     def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
@@ -43,12 +59,13 @@ class HumanApprovalHook(HookProvider):
 
     def _handle_before_tool_call(self, event: BeforeToolCallEvent) -> None:
         """ツール実行前に承認を求める。"""
-        tool_name = event.tool_use["name"] if event.tool_use else ""
-        tool_input = event.tool_use["input"] or {} if event.tool_use else {}
+        tool_use = event.tool_use
+        tool_name = tool_use["name"] if tool_use else ""
 
-        # 対象ツール以外はスキップ
+        # 対象ツール以外はスキップ（入力パラメータは対象ツールの場合のみ取り出す）
         if tool_name not in self._target_tools:
             return
+        tool_input = tool_use["input"] or {}
 
         # コールバックが設定されている場合はコールバックを使用
         if self._approval_callback is not None:
@@ -86,13 +103,8 @@ class HumanApprovalHook(HookProvider):
             tool_name: ツール名
             tool_input: ツール入力パラメータ
         """
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("📝 申請書を生成します。よろしいですか？")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("[1] OK（申請書を生成する）")
-        print("[2] 修正（内容を修正する）")
-        print("[3] キャンセル（申請を中止する）")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        sys.stdout.write(_APPROVAL_PROMPT)
+        sys.stdout.flush()
 
     def _get_user_choice(self) -> str:
         """ユーザーの選択を取得する。
@@ -103,7 +115,7 @@ class HumanApprovalHook(HookProvider):
         while True:
             try:
                 choice = input("選択してください [1/2/3]: ").strip()
-                if choice in ("1", "2", "3"):
+                if choice in _VALID_CHOICES:
                     return choice
                 print("1, 2, 3 のいずれかを入力してください。")
             except (KeyboardInterrupt, EOFError):
@@ -0,0 +1,120 @@
+"""ジッター付きモデル呼び出しリトライ戦略
+
+ModelRetryStrategy の固定倍率の指数バックオフを、Decorrelated Jitter による
+バックオフに置き換えたリトライ戦略。
+"""
+import random
+from typing import Callable, Optional
+
+from botocore.exceptions import ClientError, ConnectionClosedError, ReadTimeoutError
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
+from strands import ModelRetryStrategy
+
+# スロットリングに加えてリトライ対象とする一時的な通信エラー
+# （接続失敗・接続タイムアウト・読み取りタイムアウト・接続切断。botocore の standard モードが
+# リトライしていた通信エラーに相当する）
+_TRANSIENT_ERRORS = (BotocoreConnectionError, ReadTimeoutError, ConnectionClosedError)
+
+# リトライ対象とするサーバー側の一時的なエラーコード（小文字で照合する。
+# ストリーミング中のエラーは先頭が小文字のコードで通知されるため）
+_RETRYABLE_ERROR_CODES = frozenset({
+    "serviceunavailableexception",
+    "internalserverexception",
+    "modelnotreadyexception",
+    "modelstreamerrorexception",
+})
+
+
+class JitteredModelRetryStrategy(ModelRetryStrategy):
+    """Decorrelated Jitter によるバックオフでモデル呼び出しをリトライする戦略。
+
+    遅延は「前回遅延の3倍」と「初期遅延」の間の一様乱数（最大遅延で上限）とする。
+    複数エージェントが同時にスロットリングされた場合でも再試行のタイミングが分散し、
+    固定倍率の指数バックオフより待ち時間の裾が短くなる。
+
+    リトライ対象はスロットリング・一時的な通信エラー・サーバー側エラー（5xx）とし、
+    バリデーションエラー・認証エラー等のクライアントエラー（4xx）は即座に失敗させる。
+    boto3 側のリトライは無効化しているため、この戦略が唯一のリトライ層となる。
+
+    応答テキストを逐次表示するエージェントでは、表示済みの途中応答が再試行で
+    重複して表示されないよう、partial_output_emitted が True を返す場合はリトライしない。
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int,
+        initial_delay: int,
+        max_delay: int,
+        partial_output_emitted: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """初期化する。
+
+        Args:
+            max_attempts: モデル呼び出しの最大試行回数
+            initial_delay: 遅延の下限（秒）
+            max_delay: 遅延の上限（秒）
+            partial_output_emitted: 失敗したモデル呼び出しで応答テキストを表示済みかを返す関数
+                （省略時は常にリトライ可能とみなす）
+        """
+        super().__init__(
+            max_attempts=max_attempts,
+            initial_delay=initial_delay,
+            max_delay=max_delay,
+        )
+        self._previous_delay = float(initial_delay)
+        self._partial_output_emitted = partial_output_emitted
+
+    def is_retryable(self, exception: Exception) -> bool:
+        """スロットリング・一時的な通信エラー・サーバー側エラーの場合のみリトライ対象とする。
+
+        途中応答を表示済みの場合は、いずれの例外でもリトライしない。
+
+        Args:
+            exception: モデル呼び出しで発生した例外
+
+        Returns:
+            bool: リトライ対象の場合True
+        """
+        if self._partial_output_emitted is not None and self._partial_output_emitted():
+            return False
+        if super().is_retryable(exception) or isinstance(exception, _TRANSIENT_ERRORS):
+            return True
+        if isinstance(exception, ClientError):
+            return _is_server_error(exception)
+        return False
+
+    def _calculate_delay(self, attempt: int) -> float:
+        """Decorrelated Jitter で次のリトライまでの遅延を計算する。
+
+        Args:
+            attempt: 試行回数（0始まり）。0の場合は前回遅延を初期化する。
+
+        Returns:
+            float: 遅延（秒）
+        """
+        if attempt == 0:
+            self._previous_delay = float(self._initial_delay)
+        delay = min(
+            float(self._max_delay),
+            random.uniform(self._initial_delay, self._previous_delay * 3),
+        )
+        self._previous_delay = delay
+        return delay
+
+
+def _is_server_error(error: ClientError) -> bool:
+    """ClientError がサーバー側の一時的なエラー（5xx）かを判定する。
+
+    Args:
+        error: boto3 の ClientError
+
+    Returns:
+        bool: サーバー側エラーの場合True
+    """
+    response = error.response or {}
+    code = response.get("Error", {}).get("Code", "")
+    if code.lower() in _RETRYABLE_ERROR_CODES:
+        return True
+    status = response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+    return status >= 500
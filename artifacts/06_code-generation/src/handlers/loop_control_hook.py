@@ -42,6 +42,10 @@ class LoopControlHook(HookProvider):
         self._max_iterations = max_iterations
         self._agent_name = agent_name
         self._loop_count = 0
+        # エージェントごとの子ロガー（ロガー名でエージェントを識別するため、メッセージには含めない）
+        self._logger = _logger.getChild(agent_name)
+        # INFOログを出力するか（呼び出し開始時に判定し、呼び出し中のイベントで使い回す）
+        self._info_enabled = self._logger.isEnabledFor(logging.INFO)
 
     def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
         """フックの登録。"""
@@ -59,7 +63,8 @@ class LoopControlHook(HookProvider):
             event: BeforeInvocationEvent
         """
         self._loop_count = 0
-        _logger.info("エージェント呼び出し開始: %s", self._agent_name)
+        self._info_enabled = self._logger.isEnabledFor(logging.INFO)
+        self._logger.info("エージェント呼び出し開始")
 
     def _handle_before_model_call(self, event: BeforeModelCallEvent) -> None:
         """モデル呼び出し前の処理。
@@ -67,7 +72,8 @@ class LoopControlHook(HookProvider):
         Args:
             event: BeforeModelCallEvent
         """
-        _logger.info("ループ回数: %d/%d", self._loop_count + 1, self._max_iterations)
+        if self._info_enabled:
+            self._logger.info("ループ回数: %d/%d", self._loop_count + 1, self._max_iterations)
 
     def _handle_after_model_call(self, event: AfterModelCallEvent) -> None:
         """モデル呼び出し後の処理。
@@ -80,10 +86,11 @@ class LoopControlHook(HookProvider):
             return
 
         self._loop_count += 1
-        _logger.info("モデル呼び出し完了: ループ回数=%d", self._loop_count)
+        if self._info_enabled:
+            self._logger.info("モデル呼び出し完了: ループ回数=%d", self._loop_count)
 
         if self._loop_count >= self._max_iterations:
-            _logger.warning(
+            self._logger.warning(
                 "ループ制御: エージェント '%s' の最大回数(%d回)に到達しました。現在のカウント: %d",
                 self._agent_name,
                 self._max_iterations,
@@ -105,8 +112,10 @@ class LoopControlHook(HookProvider):
         Args:
             event: BeforeToolCallEvent
         """
-        tool_name = self._get_tool_name(event)
-        _logger.info("ツール呼び出し開始: %s", tool_name)
+        # ログ出力しない場合はツール名も取り出さない
+        if not self._info_enabled:
+            return
+        self._logger.info("ツール呼び出し開始: %s", self._get_tool_name(event))
 
     def _handle_after_tool_call(self, event: AfterToolCallEvent) -> None:
         """ツール呼び出し後の処理。
@@ -114,8 +123,10 @@ class LoopControlHook(HookProvider):
         Args:
             event: AfterToolCallEvent
         """
-        tool_name = self._get_tool_name(event)
-        _logger.info("ツール呼び出し完了: %s", tool_name)
+        # ログ出力しない場合はツール名も取り出さない
+        if not self._info_enabled:
+            return
+        self._logger.info("ツール呼び出し完了: %s", self._get_tool_name(event))
 
     def _handle_after_invocation(self, event: AfterInvocationEvent) -> None:
         """エージェント呼び出し終了時の処理。
@@ -123,4 +134,4 @@ class LoopControlHook(HookProvider):
         Args:
             event: AfterInvocationEvent
         """
-        _logger.info("エージェント呼び出し完了: 合計ループ回数=%d", self._loop_count)
+        self._logger.info("エージェント呼び出し完了: 合計ループ回数=%d", self._loop_count)
@@ -27,6 +27,7 @@ _TRANSPORTATION_EXPENSE_POLICIES_TEMPLATE = """\
 
 ### BRL-11: 駅名の正規化
 - ユーザーが入力した駅名の表記ゆれを正規化すること
+- 末尾の「駅」の有無は calculate_transportation_cost ツールが正規化するため、確認不要
 - 正規化できない駅名の場合は、正しい駅名の確認をユーザーに求める
 
 ### BRL-17: 業務目的の必須チェック
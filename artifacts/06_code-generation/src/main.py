@@ -1,59 +1,89 @@
 """マルチエージェントアプリケーション - メインエントリーポイント"""
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from dotenv import load_dotenv
 
-# .envファイルを読み込み
-load_dotenv()
+_logger = logging.getLogger(__name__)
 
-# ログレベルの取得
-log_level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+# ログ出力を設定済みか（ハンドラーの重複登録・リスナーの多重起動を防ぐ）
+_logging_configured = False
 
-# ログディレクトリの作成
-os.makedirs("logs", exist_ok=True)
 
-# ログフォーマッターの作成
-_fmt = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
-_formatter = logging.Formatter(_fmt)
+def _configure_logging() -> None:
+    """ログ出力を設定する。
 
-# app.log ハンドラー（INFO以上、RotatingFileHandler: 10MB × 5世代）
-_app_handler = RotatingFileHandler(
-    "logs/app.log", maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
-)
-_app_handler.setLevel(logging.INFO)
-_app_handler.setFormatter(_formatter)
+    インポート時の副作用を避けるため main() から呼び出す。
+    2回目以降の呼び出しでは何もしない。
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
 
-# error.log ハンドラー（ERROR以上、RotatingFileHandler: 10MB × 5世代）
-_error_handler_file = RotatingFileHandler(
-    "logs/error.log", maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
-)
-_error_handler_file.setLevel(logging.ERROR)
-_error_handler_file.setFormatter(_formatter)
+    # .envファイルを読み込み
+    load_dotenv()
 
-# コンソールハンドラー（INFO以上）
-_console_handler = logging.StreamHandler()
-_console_handler.setLevel(logging.INFO)
-_console_handler.setFormatter(_formatter)
+    # ログレベルの取得
+    log_level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
 
-# logging.basicConfigの設定（3ハンドラー構成）
-logging.basicConfig(
-    level=log_level,
-    handlers=[_console_handler, _app_handler, _error_handler_file],
-)
+    # ログディレクトリの作成
+    os.makedirs("logs", exist_ok=True)
 
-# Strandsライブラリのログレベル制御（WARNING: 過剰なデバッグ出力を抑制）
-logging.getLogger("strands").setLevel(logging.WARNING)
+    # ログフォーマッターの作成
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+
+    # app.log ハンドラー（INFO以上、RotatingFileHandler: 10MB × 5世代）
+    app_handler = RotatingFileHandler(
+        "logs/app.log", maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
+    )
+    app_handler.setLevel(logging.INFO)
+    app_handler.setFormatter(formatter)
+
+    # error.log ハンドラー（ERROR以上、RotatingFileHandler: 10MB × 5世代）
+    error_handler_file = RotatingFileHandler(
+        "logs/error.log", maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
+    )
+    error_handler_file.setLevel(logging.ERROR)
+    error_handler_file.setFormatter(formatter)
+
+    # コンソールハンドラー（INFO以上）
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+
+    # ファイル出力はバックグラウンドスレッドで行い、ログ出力元のスレッドをディスクI/Oで待たせない
+    # （コンソール出力は対話中の表示順を保つため同期のままとする）
+    log_queue: queue.Queue = queue.Queue(-1)
+    file_log_listener = QueueListener(
+        log_queue, app_handler, error_handler_file, respect_handler_level=True
+    )
+    file_log_listener.start()
+    atexit.register(file_log_listener.stop)
+    queue_handler = QueueHandler(log_queue)
+    # 書式はファイルハンドラー側で適用するため、キューにはメッセージ本文のみを渡す
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # logging.basicConfigの設定（コンソール + ファイル出力キューの構成）
+    logging.basicConfig(
+        level=log_level,
+        handlers=[console_handler, queue_handler],
+    )
+
+    # Strandsライブラリのログレベル制御（WARNING: 過剰なデバッグ出力を抑制）
+    logging.getLogger("strands").setLevel(logging.WARNING)
 
 
 def main() -> None:
     """メイン関数"""
-    from agents.orchestrator_agent import OrchestratorAgent
+    _configure_logging()
+
     from handlers.error_handler import ErrorHandler
 
-    _logger = logging.getLogger(__name__)
     _logger.info("システム起動")
 
     try:
@@ -63,6 +93,9 @@ def main() -> None:
         if not applicant_name:
             applicant_name = "未入力"
 
+        # Strands・boto3 を含むエージェント群の読み込みは申請者名の入力後に行い、入力プロンプトを即時に表示する
+        from agents.orchestrator_agent import OrchestratorAgent
+
         agent = OrchestratorAgent(applicant_name=applicant_name)
         agent.run()
         _logger.info("システム正常終了")
@@ -4,13 +4,25 @@
 各モデルはツール入力、エージェント状態、マスタデータの型安全性を保証する。
 """
 import re
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from typing import Optional, Literal
+
+from dateutil.relativedelta import relativedelta
 from pydantic import BaseModel, Field, field_validator
 
 
 # ============ 共通バリデーター ============
 
+# 金額文字列から除去する文字（桁区切りカンマ（半角・全角）と通貨単位）
+_AMOUNT_STRIP_TABLE = str.maketrans("", "", ",，円")
+
+# 日付文字列の受け付け形式（YYYY-MM-DD / YYYY/MM/DD / YYYY年MM月DD日）
+_ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_SLASH_DATE_PATTERN = re.compile(r"^\d{4}/\d{2}/\d{2}$")
+_JAPANESE_DATE_PATTERN = re.compile(r"^(\d{4})年(\d{1,2})月(\d{1,2})日$")
+
+
 def validate_date(v: str) -> str:
     """日付文字列を YYYY-MM-DD 形式に正規化する。
 
@@ -26,24 +38,39 @@ def validate_date(v: str) -> str:
     if not v or not isinstance(v, str):
         raise ValueError("日付が入力されていません")
 
-    v = v.strip()
+    return _normalize_date_string(v.strip())
+
+
+@lru_cache(maxsize=1024)
+def _normalize_date_string(v: str) -> str:
+    """前後の空白を除去済みの日付文字列を YYYY-MM-DD 形式に正規化する。
+
+    同じ申請内では同じ日付が繰り返し検証されるため、結果をキャッシュする
+    （ValueError を送出した入力はキャッシュされない）。
+
+    Args:
+        v: 日付文字列
+
+    Returns:
+        YYYY-MM-DD形式の日付文字列
 
+    Raises:
+        ValueError: パース不可能な日付形式の場合
+    """
     # YYYY-MM-DD形式
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", v):
-        datetime.strptime(v, "%Y-%m-%d")
+    if _ISO_DATE_PATTERN.match(v):
+        date.fromisoformat(v)
         return v
 
-    # YYYY/MM/DD形式
-    if re.match(r"^\d{4}/\d{2}/\d{2}$", v):
-        parsed = datetime.strptime(v, "%Y/%m/%d")
-        return parsed.strftime("%Y-%m-%d")
+    # YYYY/MM/DD形式（書式解析を伴う strptime/strftime を使わず整数フィールドから組み立てる）
+    if _SLASH_DATE_PATTERN.match(v):
+        return date(int(v[0:4]), int(v[5:7]), int(v[8:10])).isoformat()
 
     # YYYY年MM月DD日形式
-    match = re.match(r"^(\d{4})年(\d{1,2})月(\d{1,2})日$", v)
+    match = _JAPANESE_DATE_PATTERN.match(v)
     if match:
         year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
-        parsed = datetime(year, month, day)
-        return parsed.strftime("%Y-%m-%d")
+        return date(year, month, day).isoformat()
 
     raise ValueError(f"日付形式が不正です: {v}（YYYY-MM-DD, YYYY/MM/DD, YYYY年MM月DD日 のいずれかで入力してください）")
 
@@ -71,7 +98,7 @@ def validate_amount(v) -> int:
         return int(v)
 
     if isinstance(v, str):
-        v = v.strip().replace(",", "").replace("円", "")
+        v = v.strip().translate(_AMOUNT_STRIP_TABLE)
         try:
             result = int(v)
         except ValueError:
@@ -108,6 +135,24 @@ def normalize_transport_type(v: str) -> str:
     return mapping.get(v, v)
 
 
+def normalize_station_name(v: str) -> str:
+    """駅名の表記を正規化する。
+
+    運賃データは「駅」を付けない駅名で登録されているため、末尾の「駅」を除去する。
+
+    Args:
+        v: 駅名・場所名文字列
+
+    Returns:
+        正規化された駅名文字列
+    """
+    if not isinstance(v, str):
+        return v
+
+    v = v.strip()
+    return v.removesuffix("駅") or v
+
+
 def normalize_expense_category(v: str) -> str:
     """経費カテゴリの表記を正規化する。
 
@@ -134,6 +179,27 @@ def normalize_expense_category(v: str) -> str:
     return mapping.get(v, v)
 
 
+@lru_cache(maxsize=8)
+def calculate_deadline_date(application_date: str, deadline_months: int) -> str:
+    """申請日から申請期限（これより前の経費は期限超過）を計算する。
+
+    申請日は日付が変わるまで同じため、呼び出しごとの日付計算をキャッシュで省く
+    （例外を送出した入力はキャッシュされない）。
+
+    Args:
+        application_date: 申請日（YYYY-MM-DD形式）
+        deadline_months: 申請期限（経費発生日からの月数）
+
+    Returns:
+        str: 申請期限（YYYY-MM-DD形式）
+
+    Raises:
+        ValueError: 申請日が YYYY-MM-DD 形式でない場合
+    """
+    app_date = date.fromisoformat(application_date)
+    return (app_date - relativedelta(months=deadline_months)).isoformat()
+
+
 # ============ エージェント状態モデル ============
 
 class InvocationState(BaseModel):
@@ -170,6 +236,11 @@ class TransportCalculatorInput(BaseModel):
     transport_type: Literal["電車", "バス", "タクシー", "飛行機"] = Field(..., description="交通手段")
     travel_date: str = Field(..., description="移動日（YYYY-MM-DD）")
 
+    @field_validator("departure", "destination", mode="before")
+    @classmethod
+    def _normalize_station_name(cls, v: str) -> str:
+        return normalize_station_name(v)
+
     @field_validator("transport_type", mode="before")
     @classmethod
     def _normalize_transport_type(cls, v: str) -> str:
@@ -224,6 +295,30 @@ class GeneralExpenseFormInput(BaseModel):
         return validated_items
 
 
+class RuleCheckInput(BaseModel):
+    """申請ルールチェックツールの入力モデル"""
+    items: list = Field(..., min_length=1, description="明細リスト（利用日・金額）")
+
+    @field_validator("items")
+    @classmethod
+    def validate_items(cls, v: list) -> list:
+        """items内の各要素のバリデーションを実行する。"""
+        validated_items = []
+        for i, item in enumerate(v):
+            try:
+                item = dict(item) if not isinstance(item, dict) else item.copy()
+            except (TypeError, ValueError):
+                raise ValueError(f"items[{i}]: 明細は date, amount を含む辞書で指定してください")
+            if "date" not in item:
+                raise ValueError(f"items[{i}]: date は必須です")
+            if "amount" not in item:
+                raise ValueError(f"items[{i}]: amount は必須です")
+            item["date"] = validate_date(item["date"])
+            item["amount"] = validate_amount(item["amount"])
+            validated_items.append(item)
+        return validated_items
+
+
 # ============ 出力生成モデル ============
 
 class TransportCalculatorOutput(BaseModel):
@@ -238,4 +333,5 @@ class FormGeneratorOutput(BaseModel):
     """精算書出力ツールの出力モデル"""
     success: bool = Field(..., description="処理成功フラグ")
     file_path: Optional[str] = Field(None, description="出力ファイルパス")
+    total_amount: Optional[int] = Field(None, ge=0, description="合計金額（円）")
     error_message: Optional[str] = Field(None, description="エラーメッセージ")
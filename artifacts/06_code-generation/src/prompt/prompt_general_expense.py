@@ -1,4 +1,6 @@
 """経費精算エージェントのシステムプロンプト"""
+from functools import lru_cache
+
 from knowledge.general_expense_policies import get_general_expense_policies
 from config.settings import settings
 
@@ -9,12 +11,6 @@ _GENERAL_EXPENSE_SYSTEM_PROMPT_TEMPLATE = """\
 
 申請者から経費精算に必要な情報を収集し、経費区分を判断し、ビジネスルールに基づいてチェックを行い、申請書を生成します。
 
-## コンテキスト情報
-
-- 申請者名: {applicant_name}
-- 申請日: {application_date}
-- 申請期限: {deadline}
-
 ## 対話フロー
 
 1. 情報収集
@@ -36,6 +32,7 @@ _GENERAL_EXPENSE_SYSTEM_PROMPT_TEMPLATE = """\
 
 3. ルールチェック
    - 以下のビジネスルールに基づいてチェックを行います
+   - 合計金額・上長承認要否・申請期限超過は、自分で計算せず必ず `check_general_expense_rules` ツールで判定してください
 
 4. ドラフト提示
    - すべてのチェックが通過したら、申請書のドラフト内容を申請者に提示します
@@ -53,10 +50,15 @@ _GENERAL_EXPENSE_SYSTEM_PROMPT_TEMPLATE = """\
 
 ## 利用可能ツール
 
+### check_general_expense_rules
+- 用途: 合計金額・上長承認要否・申請期限超過の判定
+- 入力: 明細一覧（利用日、金額）
+- 出力: 判定結果（合計金額、上長承認要否、期限超過の利用日一覧）
+
 ### generate_general_expense_form
 - 用途: 経費精算申請書（Excel）の生成
 - 入力: 申請データ一覧
-- 出力: 生成結果（成功/失敗、ファイルパス）
+- 出力: 生成結果（成功/失敗、ファイルパス、合計金額）
 - 注意: 必ず申請者の承認を得てから実行すること
 
 ## 応答ルール
@@ -66,13 +68,39 @@ _GENERAL_EXPENSE_SYSTEM_PROMPT_TEMPLATE = """\
 - 申請者の承認なしに申請書を生成してはいけません
 """
 
+# 申請者・申請日ごとに変わる部分（キャッシュポイントより後ろに置く）
+_GENERAL_EXPENSE_CONTEXT_TEMPLATE = """\
+## コンテキスト情報
+
+- 申請者名: {applicant_name}
+- 申請日: {application_date}
+- 申請期限: {deadline}
+"""
+
+
+@lru_cache(maxsize=1)
+def get_general_expense_system_prompt() -> str:
+    """経費精算エージェントのシステムプロンプト（申請者・申請日に依存しない部分）を生成する。
 
-def get_general_expense_system_prompt(
+    全セッションで同一の文字列となるため、Bedrock のプロンプトキャッシュを
+    セッション・日付をまたいで共有できる。
+
+    Returns:
+        システムプロンプト文字列
+    """
+    policies = get_general_expense_policies(
+        deadline_months=settings.general_expense.deadline_months,
+        approval_threshold=settings.general_expense.approval_threshold,
+    )
+    return _GENERAL_EXPENSE_SYSTEM_PROMPT_TEMPLATE.format(general_expense_policies=policies)
+
+
+def get_general_expense_context_prompt(
     applicant_name: str,
     application_date: str,
     deadline: str,
 ) -> str:
-    """経費精算エージェントのシステムプロンプトを生成する。
+    """経費精算エージェントのコンテキスト情報（申請者名・申請日・申請期限）を生成する。
 
     Args:
         applicant_name: 申請者名
@@ -80,15 +108,10 @@ def get_general_expense_system_prompt(
         deadline: 申請期限（YYYY-MM-DD形式）
 
     Returns:
-        システムプロンプト文字列
+        コンテキスト情報の文字列
     """
-    policies = get_general_expense_policies(
-        deadline_months=settings.general_expense.deadline_months,
-        approval_threshold=settings.general_expense.approval_threshold,
-    )
-    return _GENERAL_EXPENSE_SYSTEM_PROMPT_TEMPLATE.format(
+    return _GENERAL_EXPENSE_CONTEXT_TEMPLATE.format(
         applicant_name=applicant_name,
         application_date=application_date,
         deadline=deadline,
-        general_expense_policies=policies,
     )
@@ -1,4 +1,6 @@
 """交通費精算エージェントのシステムプロンプト"""
+from functools import lru_cache
+
 from knowledge.transportation_expense_policies import get_transportation_expense_policies
 from config.settings import settings
 
@@ -9,12 +11,6 @@ _TRANSPORTATION_EXPENSE_SYSTEM_PROMPT_TEMPLATE = """\
 
 申請者から交通費精算に必要な情報を収集し、ビジネスルールに基づいてチェックを行い、申請書を生成します。
 
-## コンテキスト情報
-
-- 申請者名: {applicant_name}
-- 申請日: {application_date}
-- 申請期限: {deadline}
-
 ## 対話フロー
 
 1. 情報収集
@@ -29,11 +25,13 @@ _TRANSPORTATION_EXPENSE_SYSTEM_PROMPT_TEMPLATE = """\
 
 2. 交通費計算
    - 収集した情報をもとに `calculate_transportation_cost` ツールで交通費を計算します
+   - 複数区間がある場合は、1区間ずつ呼び出さず `calculate_transportation_costs` ツールで全区間をまとめて計算します
    - 自動計算できない場合（経路未登録）は、実際にかかった金額をユーザーに入力してもらい、その金額で申請を進めてください
    - 計算結果を申請者に提示してください
 
 3. ルールチェック
    - 以下のビジネスルールに基づいてチェックを行います
+   - 合計金額・上長承認要否・申請期限超過は、自分で計算せず必ず `check_transportation_expense_rules` ツールで判定してください
    - ルール違反がある場合は申請者に理由を説明し、修正を促してください
 
 4. ドラフト提示
@@ -47,7 +45,7 @@ _TRANSPORTATION_EXPENSE_SYSTEM_PROMPT_TEMPLATE = """\
 
 6. 申請書生成
    - 承認を得たら `generate_transportation_expense_form` ツールで申請書を生成します
-   - 生成結果（ファイルパス等）を申請者に報告してください
+   - 生成結果（ファイルパス・合計金額）を申請者に報告してください。合計金額はツールが返した値を使用してください
 
 ## 適用ビジネスルール
 
@@ -60,10 +58,20 @@ _TRANSPORTATION_EXPENSE_SYSTEM_PROMPT_TEMPLATE = """\
 - 入力: 出発地、目的地、交通手段、移動日
 - 出力: 計算結果（金額、期限超過フラグ）
 
+### calculate_transportation_costs
+- 用途: 複数区間の交通費の一括計算
+- 入力: 区間一覧（出発地、目的地、交通手段、移動日）
+- 出力: 区間ごとの計算結果（入力と同じ順序）
+
+### check_transportation_expense_rules
+- 用途: 合計金額・上長承認要否・申請期限超過の判定
+- 入力: 明細一覧（利用日、金額）
+- 出力: 判定結果（合計金額、上長承認要否、期限超過の利用日一覧）
+
 ### generate_transportation_expense_form
 - 用途: 交通費精算申請書（Excel）の生成
 - 入力: 申請データ一覧
-- 出力: 生成結果（成功/失敗、ファイルパス）
+- 出力: 生成結果（成功/失敗、ファイルパス、合計金額）
 - 注意: 必ず申請者の承認を得てから実行すること
 
 ## 応答ルール
@@ -74,13 +82,39 @@ _TRANSPORTATION_EXPENSE_SYSTEM_PROMPT_TEMPLATE = """\
 - 申請者の承認なしに申請書を生成してはいけません
 """
 
+# 申請者・申請日ごとに変わる部分（キャッシュポイントより後ろに置く）
+_TRANSPORTATION_EXPENSE_CONTEXT_TEMPLATE = """\
+## コンテキスト情報
+
+- 申請者名: {applicant_name}
+- 申請日: {application_date}
+- 申請期限: {deadline}
+"""
+
 
-def get_transportation_expense_system_prompt(
+@lru_cache(maxsize=1)
+def get_transportation_expense_system_prompt() -> str:
+    """交通費精算エージェントのシステムプロンプト（申請者・申請日に依存しない部分）を生成する。
+
+    全セッションで同一の文字列となるため、Bedrock のプロンプトキャッシュを
+    セッション・日付をまたいで共有できる。
+
+    Returns:
+        システムプロンプト文字列
+    """
+    policies = get_transportation_expense_policies(
+        deadline_months=settings.transportation_expense.deadline_months,
+        approval_threshold=settings.transportation_expense.approval_threshold,
+    )
+    return _TRANSPORTATION_EXPENSE_SYSTEM_PROMPT_TEMPLATE.format(transportation_expense_policies=policies)
+
+
+def get_transportation_expense_context_prompt(
     applicant_name: str,
     application_date: str,
     deadline: str,
 ) -> str:
-    """交通費精算エージェントのシステムプロンプトを生成する。
+    """交通費精算エージェントのコンテキスト情報（申請者名・申請日・申請期限）を生成する。
 
     Args:
         applicant_name: 申請者名
@@ -88,15 +122,10 @@ def get_transportation_expense_system_prompt(
         deadline: 申請期限（YYYY-MM-DD形式）
 
     Returns:
-        システムプロンプト文字列
+        コンテキスト情報の文字列
     """
-    policies = get_transportation_expense_policies(
-        deadline_months=settings.transportation_expense.deadline_months,
-        approval_threshold=settings.transportation_expense.approval_threshold,
-    )
-    return _TRANSPORTATION_EXPENSE_SYSTEM_PROMPT_TEMPLATE.format(
+    return _TRANSPORTATION_EXPENSE_CONTEXT_TEMPLATE.format(
         applicant_name=applicant_name,
         application_date=application_date,
         deadline=deadline,
-        transportation_expense_policies=policies,
     )
@@ -4,7 +4,6 @@ FileSessionManagerを使用してエージェントの会話履歴と状態を
 """
 import os
 import uuid
-from datetime import datetime
 
 from strands.session.file_session_manager import FileSessionManager
 
@@ -21,18 +20,17 @@ class SessionManagerFactory:
     _STORAGE_DIR = "storage/sessions"
 
     # リセットコマンドの一覧
-    _RESET_COMMANDS = {"reset", "リセット", "最初から"}
+    _RESET_COMMANDS = frozenset({"reset", "リセット", "最初から"})
 
     @staticmethod
     def generate_session_id() -> str:
         """セッションIDを生成する。
 
         Returns:
-            session_{YYYYMMDD_HHMMSS}_{ランダム8文字}形式のセッションID
+            session_{UUID4の32桁16進文字列}形式のセッションID
+            （開始日時はセッション開始ログのタイムスタンプで確認する）
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        random_suffix = uuid.uuid4().hex[:8]
-        return f"session_{timestamp}_{random_suffix}"
+        return f"session_{uuid.uuid4().hex}"
 
     @staticmethod
     def create(session_id: str) -> FileSessionManager:
@@ -2,125 +2,221 @@
 
 複数モジュールを組み合わせた連携動作を検証する。
 """
+import asyncio
+import threading
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from agents.base_agent import calculate_deadline, invoke_specialist_agent
+import agents.base_agent as base_agent
+from agents.base_agent import (
+    calculate_deadline,
+    invoke_specialist_agent_async,
+)
 from handlers.error_handler import LoopLimitError
 
 
-class TestInvocationStatePropagation:
-    """invocation_state伝播のテスト"""
+@pytest.fixture(autouse=True)
+def clear_agent_cache():
+    """テスト間で専門エージェントのキャッシュを共有しないよう、前後で破棄する"""
+    base_agent._agent_cache.clear()
+    yield
+    base_agent._agent_cache.clear()
 
-    def test_session_id_excluded_from_child_invocation_state(self):
-        """子エージェントへの invocation_state に session_id が含まれないこと"""
-        captured_invocation_state = {}
 
-        def mock_build_agent(session_id, applicant_name, application_date, deadline):
-            agent = MagicMock()
+class _WaitObservableLock:
+    """ブロッキング取得の開始を threading.Event で通知するロック"""
 
-            def mock_call(query, invocation_state=None):
-                captured_invocation_state.update(invocation_state or {})
-                return "テスト応答"
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.waiting = threading.Event()
 
-            agent.__call__ = mock_call
-            return agent
+    def acquire(self, blocking=True):
+        if blocking:
+            self.waiting.set()
+        return self._lock.acquire(blocking)
 
+    def release(self):
+        self._lock.release()
+
+    def locked(self):
+        return self._lock.locked()
+
+
+class TestInvocationStatePropagation:
+    """invocation_state伝播のテスト"""
+
+    def _make_tool_context(self, session_id):
         tool_context = MagicMock()
         tool_context.invocation_state = {
             "applicant_name": "山田太郎",
             "application_date": "2026-05-23",
-            "session_id": "session_20260523_143022_a1b2c3d4",
+            "session_id": session_id,
         }
+        return tool_context
+
+    def _invoke(self, agent, session_id):
+        def mock_build_agent(session_id, applicant_name, application_date, deadline):
+            return agent
+
+        return asyncio.run(
+            invoke_specialist_agent_async(
+                query="テストクエリ",
+                tool_context=self._make_tool_context(session_id),
+                agent_id="AG-002",
+                deadline_months=3,
+                build_agent=mock_build_agent,
+            )
+        )
+
+    def test_session_id_excluded_from_child_invocation_state(self):
+        """子エージェントへの invocation_state に session_id が含まれないこと"""
+        captured_invocation_state = {}
+
+        async def mock_invoke_async(query, invocation_state=None):
+            captured_invocation_state.update(invocation_state or {})
+            return "テスト応答"
 
-        with patch("agents.base_agent.SessionManagerFactory"):
-            with patch("agents.base_agent.HumanApprovalHook"):
-                with patch("agents.base_agent.LoopControlHook"):
-                    with patch("agents.base_agent.Agent") as mock_agent_cls:
-                        mock_agent = MagicMock()
-                        mock_agent.return_value = "テスト応答"
-                        mock_agent_cls.return_value = mock_agent
-
-                        result = invoke_specialist_agent(
-                            query="テストクエリ",
-                            tool_context=tool_context,
-                            agent_id="AG-002",
-                            deadline_months=3,
-                            build_agent=mock_build_agent,
-                        )
+        agent = MagicMock()
+        agent.invoke_async = mock_invoke_async
+
+        result = self._invoke(agent, "session_20260523_143022_a1b2c3d4")
 
         # session_id が子エージェントに渡されていないこと
+        assert result == "テスト応答"
         assert "session_id" not in captured_invocation_state
         assert captured_invocation_state.get("applicant_name") == "山田太郎"
         assert captured_invocation_state.get("application_date") == "2026-05-23"
 
     def test_loop_limit_error_returns_error_message(self):
         """LoopLimitError発生時にエラーメッセージが返ること"""
-        def mock_build_agent(session_id, applicant_name, application_date, deadline):
-            agent = MagicMock()
-            agent.side_effect = LoopLimitError(10, 10, "テストエージェント")
-            return agent
+        agent = MagicMock()
+        agent.invoke_async = AsyncMock(side_effect=LoopLimitError(10, 10, "テストエージェント"))
 
-        tool_context = MagicMock()
-        tool_context.invocation_state = {
-            "applicant_name": "山田太郎",
-            "application_date": "2026-05-23",
-            "session_id": "test_session",
-        }
-
-        with patch("agents.base_agent.SessionManagerFactory"):
-            with patch("agents.base_agent.HumanApprovalHook"):
-                with patch("agents.base_agent.LoopControlHook"):
-                    with patch("agents.base_agent.Agent") as mock_agent_cls:
-                        mock_agent = MagicMock()
-                        mock_agent.side_effect = LoopLimitError(10, 10, "テストエージェント")
-                        mock_agent_cls.return_value = mock_agent
-
-                        result = invoke_specialist_agent(
-                            query="テストクエリ",
-                            tool_context=tool_context,
-                            agent_id="AG-002",
-                            deadline_months=3,
-                            build_agent=mock_build_agent,
-                        )
+        result = self._invoke(agent, "test_session")
 
         assert isinstance(result, str)
         assert len(result) > 0
 
     def test_unexpected_error_returns_error_message(self):
         """予期しないエラー発生時にエラーメッセージが返ること"""
-        def mock_build_agent(session_id, applicant_name, application_date, deadline):
-            agent = MagicMock()
-            agent.side_effect = RuntimeError("予期しないエラー")
-            return agent
+        agent = MagicMock()
+        agent.invoke_async = AsyncMock(side_effect=RuntimeError("予期しないエラー"))
+
+        result = self._invoke(agent, "test_session")
+
+        assert isinstance(result, str)
+        assert len(result) > 0
 
+
+class TestAsyncInvocation:
+    """invoke_specialist_agent_async のテスト"""
+
+    def _make_tool_context(self):
         tool_context = MagicMock()
         tool_context.invocation_state = {
             "applicant_name": "山田太郎",
             "application_date": "2026-05-23",
-            "session_id": "test_session",
+            "session_id": "test_session_async",
         }
+        return tool_context
 
-        with patch("agents.base_agent.SessionManagerFactory"):
-            with patch("agents.base_agent.HumanApprovalHook"):
-                with patch("agents.base_agent.LoopControlHook"):
-                    with patch("agents.base_agent.Agent") as mock_agent_cls:
-                        mock_agent = MagicMock()
-                        mock_agent.side_effect = RuntimeError("予期しないエラー")
-                        mock_agent_cls.return_value = mock_agent
-
-                        result = invoke_specialist_agent(
-                            query="テストクエリ",
-                            tool_context=tool_context,
-                            agent_id="AG-002",
-                            deadline_months=3,
-                            build_agent=mock_build_agent,
-                        )
+    def test_invoke_async_receives_child_invocation_state(self):
+        """invoke_async に session_id を除いた invocation_state が渡されること"""
+        agent = MagicMock()
+        agent.invoke_async = AsyncMock(return_value="テスト応答")
+
+        def mock_build_agent(session_id, applicant_name, application_date, deadline):
+            return agent
+
+        result = asyncio.run(
+            invoke_specialist_agent_async(
+                query="テストクエリ",
+                tool_context=self._make_tool_context(),
+                agent_id="AG-003",
+                deadline_months=3,
+                build_agent=mock_build_agent,
+            )
+        )
+
+        assert result == "テスト応答"
+        agent.invoke_async.assert_awaited_once_with(
+            "テストクエリ",
+            invocation_state={"applicant_name": "山田太郎", "application_date": "2026-05-23"},
+        )
+
+    def test_loop_limit_error_returns_error_message(self):
+        """LoopLimitError発生時にエラーメッセージが返ること"""
+        agent = MagicMock()
+        agent.invoke_async = AsyncMock(side_effect=LoopLimitError(10, 10, "テストエージェント"))
+
+        def mock_build_agent(session_id, applicant_name, application_date, deadline):
+            return agent
+
+        result = asyncio.run(
+            invoke_specialist_agent_async(
+                query="テストクエリ",
+                tool_context=self._make_tool_context(),
+                agent_id="AG-003",
+                deadline_months=3,
+                build_agent=mock_build_agent,
+            )
+        )
 
         assert isinstance(result, str)
         assert len(result) > 0
 
 
+    def test_cancelled_waiting_call_does_not_leak_agent_lock(self):
+        """ロック待ちの呼び出しがキャンセルされても、ロックが解放されたままにならないこと"""
+        first_running = asyncio.Event()
+        release_first = asyncio.Event()
+
+        async def slow_invoke_async(query, invocation_state=None):
+            first_running.set()
+            await release_first.wait()
+            return "テスト応答"
+
+        agent = MagicMock()
+        agent.invoke_async = slow_invoke_async
+
+        def mock_build_agent(session_id, applicant_name, application_date, deadline):
+            return agent
+
+        def call():
+            return invoke_specialist_agent_async(
+                query="テストクエリ",
+                tool_context=self._make_tool_context(),
+                agent_id="AG-003",
+                deadline_months=3,
+                build_agent=mock_build_agent,
+            )
+
+        # キャッシュ済みエントリのロックを、待機開始を観測できるロックに差し替える
+        base_agent._prepare_specialist_call(
+            self._make_tool_context(), "AG-003", 3, mock_build_agent
+        )
+        (key,) = base_agent._agent_cache
+        agent_lock = _WaitObservableLock()
+        base_agent._agent_cache[key] = (agent, agent_lock)
+
+        async def scenario():
+            first = asyncio.create_task(call())
+            await first_running.wait()
+            second = asyncio.create_task(call())
+            # 2件目が待機スレッドでロック取得を開始するまで待つ
+            await asyncio.to_thread(agent_lock.waiting.wait)
+            second.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await second
+            release_first.set()
+            assert await first == "テスト応答"
+
+        # asyncio.run は終了時に待機スレッドの完了を待つ
+        asyncio.run(scenario())
+        assert not agent_lock.locked()
+
+
 class TestCalculateDeadlineIntegration:
     """calculate_deadline結合テスト"""
 
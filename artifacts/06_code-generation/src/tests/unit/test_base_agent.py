@@ -3,7 +3,8 @@ import logging
 import pytest
 from unittest.mock import MagicMock, patch
 
-from agents.base_agent import calculate_deadline
+import agents.base_agent as base_agent
+from agents.base_agent import build_cached_system_prompt, calculate_deadline, get_response_text
 
 
 class TestCalculateDeadline:
@@ -30,3 +31,288 @@ class TestCalculateDeadline:
             calculate_deadline("invalid-date", 3)
         assert "申請期限の計算に失敗しました" in caplog.text
         assert "application_date='invalid-date'" in caplog.text
+
+    def test_invalid_date_logs_warning_every_call(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="agents.base_agent"):
+            calculate_deadline("invalid-date", 3)
+            calculate_deadline("invalid-date", 3)
+        assert caplog.text.count("申請期限の計算に失敗しました") == 2
+
+
+class TestBuildCachedSystemPrompt:
+    """build_cached_system_prompt関数のテスト"""
+
+    def test_text_block_first(self):
+        result = build_cached_system_prompt("テストプロンプト")
+        assert result[0] == {"text": "テストプロンプト"}
+
+    def test_cache_point_last(self):
+        result = build_cached_system_prompt("テストプロンプト")
+        assert result[-1] == {"cachePoint": {"type": "default"}}
+
+    def test_context_after_cache_point(self):
+        result = build_cached_system_prompt("テストプロンプト", "申請者名: 山田太郎")
+        assert result == [
+            {"text": "テストプロンプト"},
+            {"cachePoint": {"type": "default"}},
+            {"text": "申請者名: 山田太郎"},
+        ]
+
+
+class TestGetOrBuildAgent:
+    """_get_or_build_agent関数のテスト"""
+
+    def setup_method(self):
+        base_agent._agent_cache.clear()
+
+    def teardown_method(self):
+        base_agent._agent_cache.clear()
+
+    def test_same_key_builds_once(self):
+        build_agent = MagicMock(return_value=MagicMock())
+        args = ("session_a", "山田太郎", "2026-05-23", "2026-02-23")
+        first, _ = base_agent._get_or_build_agent(build_agent, *args)
+        second, _ = base_agent._get_or_build_agent(build_agent, *args)
+        assert first is second
+        build_agent.assert_called_once_with(*args)
+
+    def test_different_session_builds_new_agent(self):
+        build_agent = MagicMock(side_effect=lambda *args: MagicMock())
+        first, _ = base_agent._get_or_build_agent(
+            build_agent, "session_a", "山田太郎", "2026-05-23", "2026-02-23"
+        )
+        second, _ = base_agent._get_or_build_agent(
+            build_agent, "session_b", "山田太郎", "2026-05-23", "2026-02-23"
+        )
+        assert first is not second
+        assert build_agent.call_count == 2
+
+    def test_oldest_entry_evicted_over_maxsize(self):
+        build_agent = MagicMock(side_effect=lambda *args: MagicMock())
+        with patch.object(base_agent, "_AGENT_CACHE_MAXSIZE", 2):
+            for session_id in ("session_a", "session_b", "session_c"):
+                base_agent._get_or_build_agent(
+                    build_agent, session_id, "山田太郎", "2026-05-23", "2026-02-23"
+                )
+        session_ids = [key[1] for key in base_agent._agent_cache]
+        assert session_ids == ["session_b", "session_c"]
+
+    def test_recently_used_entry_survives_eviction(self):
+        build_agent = MagicMock(side_effect=lambda *args: MagicMock())
+        with patch.object(base_agent, "_AGENT_CACHE_MAXSIZE", 2):
+            for session_id in ("session_a", "session_b", "session_a", "session_c"):
+                base_agent._get_or_build_agent(
+                    build_agent, session_id, "山田太郎", "2026-05-23", "2026-02-23"
+                )
+        session_ids = [key[1] for key in base_agent._agent_cache]
+        assert session_ids == ["session_a", "session_c"]
+        assert build_agent.call_count == 3
+
+
+def _text_message(role, text):
+    return {"role": role, "content": [{"text": text}]}
+
+
+class TestBudgetedSlidingWindowConversationManager:
+    """BudgetedSlidingWindowConversationManagerのテスト"""
+
+    def test_within_budget_keeps_messages(self):
+        agent = MagicMock()
+        agent.messages = [
+            _text_message("user", "あ" * 10),
+            _text_message("assistant", "い" * 10),
+        ]
+        manager = base_agent.BudgetedSlidingWindowConversationManager(
+            window_size=15, history_char_budget=100
+        )
+        manager.apply_management(agent)
+        assert len(agent.messages) == 2
+
+    def test_over_budget_trims_oldest_messages(self):
+        agent = MagicMock()
+        agent.messages = [
+            _text_message("user", "あ" * 100),
+            _text_message("assistant", "い" * 100),
+            _text_message("user", "う" * 10),
+            _text_message("assistant", "え" * 10),
+        ]
+        manager = base_agent.BudgetedSlidingWindowConversationManager(
+            window_size=15, history_char_budget=50
+        )
+        manager.apply_management(agent)
+        assert [m["content"][0]["text"][0] for m in agent.messages] == ["う", "え"]
+
+    def test_over_budget_trims_to_half_budget(self):
+        agent = MagicMock()
+        agent.messages = [
+            _text_message("user", "あ" * 30),
+            _text_message("assistant", "い" * 30),
+            _text_message("user", "う" * 10),
+            _text_message("assistant", "え" * 10),
+            _text_message("user", "お" * 10),
+            _text_message("assistant", "か" * 10),
+        ]
+        manager = base_agent.BudgetedSlidingWindowConversationManager(
+            window_size=15, history_char_budget=50
+        )
+        manager.apply_management(agent)
+        # 上限の半分（25文字）以下になるまでターン単位で削減する
+        assert [m["content"][0]["text"][0] for m in agent.messages] == ["お", "か"]
+        assert manager.removed_message_count == 4
+
+    def test_trims_one_turn_at_a_time_beyond_window_size(self):
+        # window_size < メッセージ数 <= window_size * 2 の場合も、ウィンドウサイズまで一度に削らない
+        agent = MagicMock()
+        agent.messages = [
+            _text_message("user", "あ" * 40),
+            _text_message("assistant", "い" * 10),
+        ] + [
+            _text_message("user" if i % 2 == 0 else "assistant", "う" * 5) for i in range(6)
+        ]
+        manager = base_agent.BudgetedSlidingWindowConversationManager(
+            window_size=4, history_char_budget=70
+        )
+        manager.apply_management(agent)
+        assert len(agent.messages) == 6
+
+        # 削減後は上限まで余裕があるため、次のターンでは削減されずプレフィックスが変わらない
+        prefix = list(agent.messages)
+        agent.messages.extend([_text_message("user", "え" * 5), _text_message("assistant", "お" * 5)])
+        manager.apply_management(agent)
+        assert agent.messages[:6] == prefix
+
+    def test_latest_turn_with_tool_pair_kept_over_budget(self):
+        agent = MagicMock()
+        agent.messages = [
+            _text_message("user", "あ" * 10),
+            _text_message("assistant", "い" * 10),
+            _text_message("user", "5月20日 東京→横浜"),
+            {
+                "role": "assistant",
+                "content": [{"toolUse": {"toolUseId": "t1", "name": "calc", "input": {"q": "x" * 100}}}],
+            },
+            {
+                "role": "user",
+                "content": [{"toolResult": {"toolUseId": "t1", "content": [{"text": "y" * 100}]}}],
+            },
+            _text_message("assistant", "運賃は480円です"),
+        ]
+        manager = base_agent.BudgetedSlidingWindowConversationManager(
+            window_size=15, history_char_budget=50
+        )
+        manager.apply_management(agent)
+        # 直近のユーザーターンとそのツール呼び出し・結果は上限を超えていても残る
+        assert agent.messages[0]["content"][0]["text"] == "5月20日 東京→横浜"
+        assert len(agent.messages) == 4
+
+    def test_latest_turn_kept_when_history_exceeds_window(self):
+        agent = MagicMock()
+        agent.messages = [
+            _text_message("user", "あ" * 10),
+            _text_message("assistant", "い" * 10),
+            _text_message("user", "5月20日 東京→横浜"),
+            {
+                "role": "assistant",
+                "content": [{"toolUse": {"toolUseId": "t1", "name": "calc", "input": {"q": "x" * 100}}}],
+            },
+            {
+                "role": "user",
+                "content": [{"toolResult": {"toolUseId": "t1", "content": [{"text": "y" * 100}]}}],
+            },
+            _text_message("assistant", "運賃は480円です"),
+        ]
+        # window_size=3 では SDK の削減位置が直近ユーザーターンより後ろになるが、ターン境界で削減する
+        manager = base_agent.BudgetedSlidingWindowConversationManager(
+            window_size=3, history_char_budget=50
+        )
+        manager.apply_management(agent)
+        assert agent.messages[0]["content"][0]["text"] == "5月20日 東京→横浜"
+        assert len(agent.messages) == 4
+
+    def test_zero_budget_disables_char_limit(self):
+        agent = MagicMock()
+        agent.messages = [
+            _text_message("user", "あ" * 100),
+            _text_message("assistant", "い" * 100),
+            _text_message("user", "う" * 100),
+            _text_message("assistant", "え" * 100),
+        ]
+        manager = base_agent.BudgetedSlidingWindowConversationManager(
+            window_size=15, history_char_budget=0
+        )
+        manager.apply_management(agent)
+        assert len(agent.messages) == 4
+
+
+class TestGetResponseText:
+    """get_response_text関数のテスト"""
+
+    def _make_result(self, content):
+        from strands.agent.agent_result import AgentResult
+        return AgentResult(
+            stop_reason="end_turn",
+            message={"role": "assistant", "content": content},
+            metrics=MagicMock(),
+            state={},
+        )
+
+    def test_single_text_block(self):
+        result = self._make_result([{"text": "応答です"}])
+        assert get_response_text(result) == "応答です"
+
+    def test_multiple_text_blocks_joined(self):
+        result = self._make_result([{"text": "一行目"}, {"text": "二行目"}])
+        assert get_response_text(result) == "一行目\n二行目"
+
+    def test_no_text_falls_back_to_str(self):
+        result = self._make_result([])
+        assert get_response_text(result) == str(result)
+
+    def test_plain_string_falls_back_to_str(self):
+        assert get_response_text("テスト応答") == "テスト応答"
+
+
+class TestCacheFriendlySlidingWindowConversationManager:
+    """CacheFriendlySlidingWindowConversationManagerのテスト"""
+
+    def _make_agent(self, count):
+        agent = MagicMock()
+        agent.messages = [
+            _text_message("user" if i % 2 == 0 else "assistant", str(i)) for i in range(count)
+        ]
+        return agent
+
+    def test_no_trim_up_to_twice_window_size(self):
+        agent = self._make_agent(4)
+        manager = base_agent.CacheFriendlySlidingWindowConversationManager(window_size=2)
+        manager.apply_management(agent)
+        assert len(agent.messages) == 4
+
+    def test_trims_to_window_size_over_twice_window_size(self):
+        agent = self._make_agent(6)
+        manager = base_agent.CacheFriendlySlidingWindowConversationManager(window_size=2)
+        manager.apply_management(agent)
+        assert [m["content"][0]["text"] for m in agent.messages] == ["4", "5"]
+
+
+class TestReleaseSpecialistAgents:
+    """release_specialist_agents関数のテスト"""
+
+    def setup_method(self):
+        base_agent._agent_cache.clear()
+
+    def teardown_method(self):
+        base_agent._agent_cache.clear()
+
+    def test_releases_only_target_session(self):
+        build_agent = MagicMock(side_effect=lambda *args: MagicMock())
+        for session_id in ("session_a", "session_b"):
+            base_agent._get_or_build_agent(
+                build_agent, session_id, "山田太郎", "2026-05-23", "2026-02-23"
+            )
+        released = base_agent.release_specialist_agents("session_a")
+        assert released == 1
+        assert [key[1] for key in base_agent._agent_cache] == ["session_b"]
+
+    def test_unknown_session_releases_nothing(self):
+        assert base_agent.release_specialist_agents("session_x") == 0
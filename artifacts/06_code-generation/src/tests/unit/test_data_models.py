@@ -3,9 +3,11 @@ import pytest
 from pydantic import ValidationError
 
 from models.data_models import (
+    calculate_deadline_date,
     validate_date,
     validate_amount,
     normalize_transport_type,
+    normalize_station_name,
     normalize_expense_category,
     TransportCalculatorInput,
     TransportationExpenseFormInput,
@@ -37,6 +39,33 @@ class TestValidateDate:
         with pytest.raises(ValueError):
             validate_date("")
 
+    def test_nonexistent_slash_date_raises(self):
+        with pytest.raises(ValueError):
+            validate_date("2026/02/30")
+
+    def test_repeated_invalid_date_raises_every_time(self):
+        # 不正な日付は結果がキャッシュされず、毎回 ValueError となること
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                validate_date("2026-02-30")
+
+    def test_surrounding_whitespace_stripped(self):
+        assert validate_date(" 2026/05/23 ") == "2026-05-23"
+
+
+class TestCalculateDeadlineDate:
+    """calculate_deadline_date関数のテスト"""
+
+    def test_subtracts_months(self):
+        assert calculate_deadline_date("2026-05-23", 3) == "2026-02-23"
+
+    def test_month_end_clamped(self):
+        assert calculate_deadline_date("2026-05-31", 3) == "2026-02-28"
+
+    def test_invalid_date_raises(self):
+        with pytest.raises(ValueError):
+            calculate_deadline_date("2026/05/23", 3)
+
 
 class TestValidateAmount:
     """validate_amount関数のテスト"""
@@ -53,6 +82,9 @@ class TestValidateAmount:
     def test_yen_string(self):
         assert validate_amount("1000円") == 1000
 
+    def test_full_width_comma_string(self):
+        assert validate_amount("1，500円") == 1500
+
     def test_zero(self):
         assert validate_amount(0) == 0
 
@@ -90,6 +122,22 @@ class TestNormalizeTransportType:
         assert normalize_transport_type("自転車") == "自転車"
 
 
+class TestNormalizeStationName:
+    """normalize_station_name関数のテスト"""
+
+    def test_strips_station_suffix(self):
+        assert normalize_station_name("東京駅") == "東京"
+
+    def test_strips_whitespace(self):
+        assert normalize_station_name(" 新宿駅 ") == "新宿"
+
+    def test_already_normalized(self):
+        assert normalize_station_name("渋谷") == "渋谷"
+
+    def test_suffix_only_kept(self):
+        assert normalize_station_name("駅") == "駅"
+
+
 class TestNormalizeExpenseCategory:
     """normalize_expense_category関数のテスト"""
 
@@ -164,6 +212,15 @@ class TestTransportCalculatorInput:
         )
         assert m.travel_date == "2026-05-23"
 
+    def test_station_name_normalization(self):
+        m = TransportCalculatorInput(
+            departure="東京駅",
+            destination="新宿駅",
+            transport_type="電車",
+            travel_date="2026-05-23",
+        )
+        assert (m.departure, m.destination) == ("東京", "新宿")
+
 
 class TestTransportationExpenseFormInput:
     """TransportationExpenseFormInputモデルのテスト"""
@@ -70,6 +70,15 @@ class TestErrorHandler:
             # 複数フィールドのエラーが含まれること
             assert "name" in result or "amount" in result
 
+    def test_handle_validation_error_message_format(self):
+        try:
+            _SampleModel(name="", amount=100)
+        except ValidationError as e:
+            result = ErrorHandler.handle_validation_error(e)
+            assert result.splitlines()[0] == "入力データに不備があります。以下の項目を確認してください。"
+            assert result.splitlines()[1].startswith("- name: ")
+            assert "http" not in result
+
     def test_handle_keyboard_interrupt_returns_str(self):
         result = ErrorHandler.handle_keyboard_interrupt(KeyboardInterrupt())
         assert isinstance(result, str)
@@ -0,0 +1,107 @@
+"""JitteredModelRetryStrategyの単体テスト"""
+from botocore.exceptions import (
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
+from strands.types.exceptions import ModelThrottledException
+
+from handlers.jittered_retry_strategy import JitteredModelRetryStrategy
+
+
+def _make_strategy():
+    return JitteredModelRetryStrategy(max_attempts=4, initial_delay=2, max_delay=30)
+
+
+class TestCalculateDelay:
+    """_calculate_delayのテスト"""
+
+    def test_delay_within_bounds(self):
+        strategy = _make_strategy()
+        for _ in range(100):
+            for attempt in range(4):
+                delay = strategy._calculate_delay(attempt)
+                assert 2 <= delay <= 30
+
+    def test_first_attempt_bounded_by_three_times_initial_delay(self):
+        strategy = _make_strategy()
+        strategy._calculate_delay(0)
+        strategy._calculate_delay(1)
+        assert strategy._calculate_delay(0) <= 6
+
+    def test_delay_capped_by_max_delay(self):
+        strategy = JitteredModelRetryStrategy(max_attempts=10, initial_delay=20, max_delay=25)
+        for attempt in range(10):
+            assert strategy._calculate_delay(attempt) <= 25
+
+
+class TestIsRetryable:
+    """is_retryableのテスト"""
+
+    def test_throttled_is_retryable(self):
+        assert _make_strategy().is_retryable(ModelThrottledException("throttled"))
+
+    def test_read_timeout_is_retryable(self):
+        assert _make_strategy().is_retryable(ReadTimeoutError(endpoint_url="https://example.com"))
+
+    def test_endpoint_connection_error_is_retryable(self):
+        assert _make_strategy().is_retryable(EndpointConnectionError(endpoint_url="https://example.com"))
+
+    def test_connect_timeout_is_retryable(self):
+        assert _make_strategy().is_retryable(ConnectTimeoutError(endpoint_url="https://example.com"))
+
+    def test_connection_closed_is_retryable(self):
+        assert _make_strategy().is_retryable(ConnectionClosedError(endpoint_url="https://example.com"))
+
+    def test_server_error_is_retryable(self):
+        error = ClientError(
+            {
+                "Error": {"Code": "ServiceUnavailableException", "Message": "unavailable"},
+                "ResponseMetadata": {"HTTPStatusCode": 503},
+            },
+            "ConverseStream",
+        )
+        assert _make_strategy().is_retryable(error)
+
+    def test_stream_internal_server_error_is_retryable(self):
+        error = ClientError(
+            {"Error": {"Code": "internalServerException", "Message": "internal error"}},
+            "ConverseStream",
+        )
+        assert _make_strategy().is_retryable(error)
+
+    def test_validation_exception_is_not_retryable(self):
+        error = ClientError(
+            {
+                "Error": {"Code": "ValidationException", "Message": "invalid input"},
+                "ResponseMetadata": {"HTTPStatusCode": 400},
+            },
+            "ConverseStream",
+        )
+        assert not _make_strategy().is_retryable(error)
+
+    def test_client_error_is_not_retryable(self):
+        assert not _make_strategy().is_retryable(ValueError("validation error"))
+
+    def test_not_retryable_after_partial_output(self):
+        strategy = JitteredModelRetryStrategy(
+            max_attempts=4, initial_delay=2, max_delay=30, partial_output_emitted=lambda: True
+        )
+        error = ClientError(
+            {"Error": {"Code": "modelStreamErrorException", "Message": "stream error"}},
+            "ConverseStream",
+        )
+        assert not strategy.is_retryable(error)
+        assert not strategy.is_retryable(ModelThrottledException("throttled"))
+
+    def test_retryable_without_partial_output(self):
+        strategy = JitteredModelRetryStrategy(
+            max_attempts=4, initial_delay=2, max_delay=30, partial_output_emitted=lambda: False
+        )
+        error = ClientError(
+            {"Error": {"Code": "modelStreamErrorException", "Message": "stream error"}},
+            "ConverseStream",
+        )
+        assert strategy.is_retryable(error)
@@ -79,3 +79,27 @@ class TestLoopControlHook:
         event = MagicMock()
         event.tool_use = None
         assert hook._get_tool_name(event) == "unknown"
+
+    def test_tool_call_hooks_skip_tool_name_when_info_disabled(self):
+        hook = LoopControlHook()
+        event = MagicMock()
+        with patch.object(hook._logger, "isEnabledFor", return_value=False), \
+                patch.object(hook, "_get_tool_name") as mock_get_tool_name:
+            hook._handle_before_invocation(MagicMock())
+            hook._handle_before_tool_call(event)
+            hook._handle_after_tool_call(event)
+        mock_get_tool_name.assert_not_called()
+
+    def test_info_enabled_snapshot_taken_at_invocation_start(self):
+        hook = LoopControlHook()
+        with patch.object(hook, "_logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            hook._handle_before_invocation(MagicMock())
+            hook._handle_before_model_call(MagicMock())
+            hook._handle_before_tool_call(MagicMock())
+        mock_logger.isEnabledFor.assert_called_once()
+        mock_logger.info.assert_called_once()  # 呼び出し開始ログのみ
+
+    def test_logs_through_per_agent_child_logger(self):
+        hook = LoopControlHook(agent_name="交通費精算申請エージェント")
+        assert hook._logger.name == "handlers.loop_control_hook.交通費精算申請エージェント"
@@ -0,0 +1,60 @@
+"""ModelConfigの単体テスト"""
+import os
+
+import pytest
+from unittest.mock import patch
+
+from config.model_config import ModelConfig
+
+
+class TestModelConfig:
+    """ModelConfigのテスト"""
+
+    def setup_method(self):
+        ModelConfig.get_model.cache_clear()
+
+    def teardown_method(self):
+        ModelConfig.get_model.cache_clear()
+
+    def test_get_model_returns_same_instance(self):
+        """BedrockModel（boto3クライアントを含む）がプロセス内で1度だけ生成されること"""
+        with patch("config.model_config.BedrockModel") as mock_model_cls:
+            first = ModelConfig.get_model()
+            second = ModelConfig.get_model()
+        assert first is second
+        mock_model_cls.assert_called_once()
+
+    def test_boto_client_config_shares_keepalive_pool(self):
+        """接続プールとTCP keepaliveが設定され、boto3側のリトライが無効化されること"""
+        with patch("config.model_config.BedrockModel") as mock_model_cls:
+            ModelConfig.get_model()
+        client_config = mock_model_cls.call_args.kwargs["boto_client_config"]
+        assert client_config.max_pool_connections == ModelConfig.MAX_POOL_CONNECTIONS
+        assert client_config.tcp_keepalive is True
+        assert client_config.retries["total_max_attempts"] == 1
+
+    def test_max_pool_connections_overridable_by_env(self):
+        """接続プールの同時接続数を環境変数で上書きできること"""
+        with patch.dict(os.environ, {"BEDROCK_MAX_POOL_CONNECTIONS": "64"}), \
+                patch("config.model_config.BedrockModel") as mock_model_cls:
+            ModelConfig.get_model()
+        client_config = mock_model_cls.call_args.kwargs["boto_client_config"]
+        assert client_config.max_pool_connections == 64
+
+    @pytest.mark.parametrize("value", ["abc", "0", "-5"])
+    def test_invalid_max_pool_connections_falls_back_to_default(self, value, caplog):
+        """不正な同時接続数は警告を出して既定値にフォールバックすること"""
+        with patch.dict(os.environ, {"BEDROCK_MAX_POOL_CONNECTIONS": value}), \
+                patch("config.model_config.BedrockModel") as mock_model_cls:
+            ModelConfig.get_model()
+        client_config = mock_model_cls.call_args.kwargs["boto_client_config"]
+        assert client_config.max_pool_connections == ModelConfig.MAX_POOL_CONNECTIONS
+        assert "BEDROCK_MAX_POOL_CONNECTIONS" in caplog.text
+
+    def test_prompt_caching_enabled_for_tools_and_messages(self):
+        """ツール定義・会話履歴のキャッシュポイントが自動挿入される設定であること"""
+        with patch("config.model_config.BedrockModel") as mock_model_cls:
+            ModelConfig.get_model()
+        cache_config = mock_model_cls.call_args.kwargs["cache_config"]
+        assert cache_config.strategy == "auto"
+        assert cache_config.tools_ttl is True
@@ -0,0 +1,167 @@
+"""OrchestratorAgentの単体テスト"""
+from datetime import date
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from agents.orchestrator_agent import OrchestratorAgent
+from handlers.error_handler import ErrorHandler, LoopLimitError
+
+
+@pytest.fixture
+def orchestrator():
+    """外部依存（セッション・モデル・Agent）をモック化したOrchestratorAgent"""
+    with patch("agents.orchestrator_agent.SessionManagerFactory") as mock_factory:
+        mock_factory.generate_session_id.return_value = "session_test"
+        with patch("agents.orchestrator_agent.ModelConfig"):
+            with patch("agents.orchestrator_agent.Agent"):
+                yield OrchestratorAgent(applicant_name="山田太郎")
+
+
+class TestGetInvocationState:
+    """_get_invocation_stateのテスト"""
+
+    def test_contains_session_values(self, orchestrator):
+        state = orchestrator._get_invocation_state()
+        assert state["applicant_name"] == "山田太郎"
+        assert state["session_id"] == "session_test"
+        assert "application_date" in state
+
+    def test_validates_once_per_day(self, orchestrator):
+        with patch("agents.orchestrator_agent.InvocationState") as mock_state_cls:
+            mock_state_cls.return_value.model_dump.return_value = {
+                "applicant_name": "山田太郎",
+                "application_date": "2000-01-01",
+                "session_id": "session_test",
+            }
+            with patch("agents.orchestrator_agent.date") as mock_date:
+                mock_date.today.return_value = date(2000, 1, 1)
+                orchestrator._get_invocation_state()
+                orchestrator._get_invocation_state()
+        mock_state_cls.assert_called_once()
+
+    def test_revalidates_when_date_changes(self, orchestrator):
+        with patch("agents.orchestrator_agent.date") as mock_date:
+            mock_date.today.return_value = date(2000, 1, 1)
+            first = orchestrator._get_invocation_state()
+            mock_date.today.return_value = date(2000, 1, 2)
+            second = orchestrator._get_invocation_state()
+        assert first["application_date"] == "2000-01-01"
+        assert second["application_date"] == "2000-01-02"
+
+    def test_returns_fresh_copy(self, orchestrator):
+        first = orchestrator._get_invocation_state()
+        first["agent"] = MagicMock()
+        second = orchestrator._get_invocation_state()
+        assert "agent" not in second
+
+
+class TestHandleUserInput:
+    """_handle_user_inputのテスト"""
+
+    @pytest.mark.parametrize("command", ["exit", "QUIT", "終了"])
+    def test_exit_commands_end_loop(self, orchestrator, command):
+        assert orchestrator._handle_user_input(command) is False
+
+    @pytest.mark.parametrize("command", ["reset", "Reset", "リセット", "最初から"])
+    def test_reset_commands_reset_session(self, orchestrator, command):
+        with patch.object(orchestrator, "_reset_session") as mock_reset:
+            assert orchestrator._handle_user_input(command) is True
+        mock_reset.assert_called_once()
+
+    def test_other_input_executes_agent(self, orchestrator):
+        with patch.object(orchestrator, "_execute_agent", return_value=(True, "応答")) as mock_execute:
+            assert orchestrator._handle_user_input("交通費を申請したい") is True
+        mock_execute.assert_called_once_with("交通費を申請したい")
+
+
+class TestExecuteAgentErrors:
+    """_execute_agentの例外振り分けのテスト（例外クラスで判定し、メッセージ文字列は見ない）"""
+
+    def test_loop_limit_error_returns_loop_limit_message(self, orchestrator):
+        error = LoopLimitError(10, 10, "申請受付窓口エージェント")
+        orchestrator._agent.side_effect = error
+        assert orchestrator._execute_agent("テスト") == (False, ErrorHandler.handle_loop_limit_error(error))
+
+    def test_runtime_error_with_loop_text_returns_runtime_message(self, orchestrator):
+        error = RuntimeError("エージェントループの制限に達しました")
+        orchestrator._agent.side_effect = error
+        assert orchestrator._execute_agent("テスト") == (False, ErrorHandler.handle_runtime_error(error))
+
+
+class TestStreaming:
+    """応答ストリーミング表示のテスト"""
+
+    def test_text_delta_written_to_stdout(self, orchestrator, capsys):
+        orchestrator._print_text_delta(data="こんにちは")
+        assert capsys.readouterr().out == "こんにちは"
+        assert orchestrator._streamed is True
+
+    def test_event_without_text_ignored(self, orchestrator, capsys):
+        orchestrator._print_text_delta(event={"messageStart": {}})
+        assert capsys.readouterr().out == ""
+        assert orchestrator._streamed is False
+
+    def test_model_call_stream_flag_reset_per_model_call(self, orchestrator, capsys):
+        orchestrator._print_text_delta(data="確認します。")
+        assert orchestrator._has_streamed_model_output() is True
+        orchestrator._reset_model_call_stream(MagicMock())
+        assert orchestrator._has_streamed_model_output() is False
+        # ターン単位の表示済みフラグは維持する
+        assert orchestrator._streamed is True
+
+    def test_unstreamed_response_printed(self, orchestrator, capsys):
+        orchestrator._stream_response = True
+        with patch.object(orchestrator, "_execute_agent", return_value=(False, "エラーが発生しました")):
+            orchestrator._handle_user_input("交通費を申請したい")
+        assert "エラーが発生しました" in capsys.readouterr().out
+
+    def test_streamed_response_not_printed_twice(self, orchestrator, capsys):
+        orchestrator._stream_response = True
+
+        def fake_execute(user_input):
+            orchestrator._print_text_delta(data="応答です")
+            return True, "応答です"
+
+        with patch.object(orchestrator, "_execute_agent", side_effect=fake_execute):
+            orchestrator._handle_user_input("交通費を申請したい")
+        assert capsys.readouterr().out.count("応答です") == 1
+
+    def test_error_after_partial_stream_printed_on_new_line(self, orchestrator, capsys):
+        orchestrator._stream_response = True
+
+        def fake_execute(user_input):
+            orchestrator._print_text_delta(data="確認します。")
+            return False, "エラーが発生しました"
+
+        with patch.object(orchestrator, "_execute_agent", side_effect=fake_execute):
+            orchestrator._handle_user_input("交通費を申請したい")
+        assert "確認します。\nエラーが発生しました" in capsys.readouterr().out
+
+    def test_loop_limit_after_partial_stream_shows_error_message(self, orchestrator, capsys):
+        orchestrator._stream_response = True
+        error = LoopLimitError(10, 10, "申請受付窓口エージェント")
+
+        def fake_agent(*args, **kwargs):
+            orchestrator._print_text_delta(data="確認します。")
+            raise error
+
+        orchestrator._agent.side_effect = fake_agent
+        orchestrator._handle_user_input("交通費を申請したい")
+        out = capsys.readouterr().out
+        assert "確認します。" in out
+        assert ErrorHandler.handle_loop_limit_error(error) in out
+
+
+class TestResetSession:
+    """_reset_sessionのテスト"""
+
+    def test_reset_changes_session_and_keeps_loop_hook(self, orchestrator):
+        loop_hook = orchestrator._loop_control_hook
+        with patch("agents.orchestrator_agent.SessionManagerFactory") as mock_factory:
+            mock_factory.generate_session_id.return_value = "session_new"
+            with patch("agents.orchestrator_agent.ModelConfig"):
+                with patch("agents.orchestrator_agent.Agent"):
+                    orchestrator._reset_session()
+        assert orchestrator._session_id == "session_new"
+        assert orchestrator._loop_control_hook is loop_hook
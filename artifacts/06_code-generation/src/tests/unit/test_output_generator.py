@@ -7,7 +7,9 @@ from tools.output_generator import (
     generate_transportation_expense_form,
     generate_general_expense_form,
     _generate_form,
+    _read_template,
     _sanitize_cell,
+    _template_cache,
 )
 
 
@@ -64,7 +66,7 @@ class TestGenerateForm:
         validated = TransportationExpenseFormInput(items=_VALID_TRANSPORT_ITEMS)
 
         with patch("os.path.exists", return_value=True):
-            with patch("tools.output_generator.load_workbook", side_effect=IOError("permission denied")):
+            with patch("openpyxl.load_workbook", side_effect=IOError("permission denied")):
                 result = _generate_form(
                     template_path="template.xlsx",
                     applicant_name="山田太郎",
@@ -103,7 +105,7 @@ class TestGenerateTransportationExpenseForm:
         mock_wb.active = MagicMock()
 
         with patch("os.path.exists", return_value=True):
-            with patch("tools.output_generator.load_workbook", return_value=mock_wb):
+            with patch("openpyxl.load_workbook", return_value=mock_wb):
                 with patch("os.makedirs"):
                     result = generate_transportation_expense_form.__wrapped__(
                         items=_VALID_TRANSPORT_ITEMS,
@@ -113,6 +115,30 @@ class TestGenerateTransportationExpenseForm:
         if result["success"]:
             assert "交通費精算申請書" in result["file_path"]
 
+    def test_success_returns_total_amount(self):
+        ctx = _make_tool_context()
+        mock_wb = MagicMock()
+
+        with patch("os.path.exists", return_value=True):
+            with patch("tools.output_generator._read_template", return_value=b""):
+                with patch("openpyxl.load_workbook", return_value=mock_wb):
+                    with patch("os.makedirs"):
+                        result = generate_transportation_expense_form.__wrapped__(
+                            items=_VALID_TRANSPORT_ITEMS + _VALID_TRANSPORT_ITEMS,
+                            tool_context=ctx,
+                        )
+
+        assert result["success"] is True
+        assert result["total_amount"] == 2 * sum(item["amount"] for item in _VALID_TRANSPORT_ITEMS)
+
+    def test_error_returns_no_total_amount(self):
+        ctx = _make_tool_context()
+        result = generate_transportation_expense_form.__wrapped__(
+            items=[],
+            tool_context=ctx,
+        )
+        assert result["total_amount"] is None
+
 
 class TestGenerateGeneralExpenseForm:
     """generate_general_expense_form関数のテスト"""
@@ -160,3 +186,32 @@ class TestSanitizeCell:
 
     def test_none_unchanged(self):
         assert _sanitize_cell(None) is None
+
+
+class TestReadTemplate:
+    """_read_template関数のテスト"""
+
+    def setup_method(self):
+        _template_cache.clear()
+
+    def teardown_method(self):
+        _template_cache.clear()
+
+    def test_returns_file_content(self, tmp_path):
+        template = tmp_path / "template.xlsx"
+        template.write_bytes(b"template-v1")
+        assert _read_template(str(template)) == b"template-v1"
+
+    def test_unchanged_file_read_once(self, tmp_path):
+        template = tmp_path / "template.xlsx"
+        template.write_bytes(b"template-v1")
+        _read_template(str(template))
+        with patch("builtins.open", side_effect=AssertionError("再読み込みされた")):
+            assert _read_template(str(template)) == b"template-v1"
+
+    def test_modified_file_reloaded(self, tmp_path):
+        template = tmp_path / "template.xlsx"
+        template.write_bytes(b"template-v1")
+        _read_template(str(template))
+        template.write_bytes(b"template-version-2")
+        assert _read_template(str(template)) == b"template-version-2"
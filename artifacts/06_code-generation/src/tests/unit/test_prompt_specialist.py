@@ -1,7 +1,15 @@
 """専門エージェントプロンプトの単体テスト"""
 from prompt.prompt_orchestrator import ORCHESTRATOR_SYSTEM_PROMPT
-from prompt.prompt_transportation_expense import get_transportation_expense_system_prompt
-from prompt.prompt_general_expense import get_general_expense_system_prompt
+import re
+
+from prompt.prompt_transportation_expense import (
+    get_transportation_expense_context_prompt,
+    get_transportation_expense_system_prompt,
+)
+from prompt.prompt_general_expense import (
+    get_general_expense_context_prompt,
+    get_general_expense_system_prompt,
+)
 
 
 class TestOrchestratorPrompt:
@@ -23,58 +31,63 @@ class TestTransportationExpensePrompt:
     """交通費精算プロンプトのテスト"""
 
     def test_returns_str(self):
-        result = get_transportation_expense_system_prompt(
-            applicant_name="山田太郎",
-            application_date="2026-05-23",
-            deadline="2026-02-23",
-        )
-        assert isinstance(result, str)
+        assert isinstance(get_transportation_expense_system_prompt(), str)
 
     def test_no_placeholders_remaining(self):
-        result = get_transportation_expense_system_prompt(
+        result = get_transportation_expense_system_prompt() + get_transportation_expense_context_prompt(
             applicant_name="山田太郎",
             application_date="2026-05-23",
             deadline="2026-02-23",
         )
-        # 未展開のプレースホルダーがないこと
-        import re
         placeholders = re.findall(r"\{[a-z_]+\}", result)
         assert len(placeholders) == 0, f"未展開プレースホルダー: {placeholders}"
 
-    def test_contains_applicant_name(self):
-        result = get_transportation_expense_system_prompt(
+    def test_context_contains_applicant_name(self):
+        result = get_transportation_expense_context_prompt(
             applicant_name="山田太郎",
             application_date="2026-05-23",
             deadline="2026-02-23",
         )
         assert "山田太郎" in result
+        assert "2026-02-23" in result
+
+    def test_system_prompt_excludes_context(self):
+        """申請者・申請日に依存する情報が共通部分に含まれないこと"""
+        assert "コンテキスト情報" not in get_transportation_expense_system_prompt()
+
+    def test_returns_cached_object(self):
+        """キャッシュされた同一オブジェクトが返されること"""
+        assert get_transportation_expense_system_prompt() is get_transportation_expense_system_prompt()
 
 
 class TestGeneralExpensePrompt:
     """経費精算プロンプトのテスト"""
 
     def test_returns_str(self):
-        result = get_general_expense_system_prompt(
-            applicant_name="鈴木花子",
-            application_date="2026-05-23",
-            deadline="2026-02-23",
-        )
-        assert isinstance(result, str)
+        assert isinstance(get_general_expense_system_prompt(), str)
 
     def test_no_placeholders_remaining(self):
-        result = get_general_expense_system_prompt(
+        result = get_general_expense_system_prompt() + get_general_expense_context_prompt(
             applicant_name="鈴木花子",
             application_date="2026-05-23",
             deadline="2026-02-23",
         )
-        import re
         placeholders = re.findall(r"\{[a-z_]+\}", result)
         assert len(placeholders) == 0, f"未展開プレースホルダー: {placeholders}"
 
-    def test_contains_applicant_name(self):
-        result = get_general_expense_system_prompt(
+    def test_context_contains_applicant_name(self):
+        result = get_general_expense_context_prompt(
             applicant_name="鈴木花子",
             application_date="2026-05-23",
             deadline="2026-02-23",
         )
         assert "鈴木花子" in result
+        assert "2026-02-23" in result
+
+    def test_system_prompt_excludes_context(self):
+        """申請者・申請日に依存する情報が共通部分に含まれないこと"""
+        assert "コンテキスト情報" not in get_general_expense_system_prompt()
+
+    def test_returns_cached_object(self):
+        """キャッシュされた同一オブジェクトが返されること"""
+        assert get_general_expense_system_prompt() is get_general_expense_system_prompt()
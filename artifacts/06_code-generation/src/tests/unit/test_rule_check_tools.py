@@ -0,0 +1,84 @@
+"""申請ルールチェックツールの単体テスト"""
+from unittest.mock import MagicMock
+
+import tools.rule_check_tools as rct
+
+
+def _make_tool_context(application_date="2026-05-23"):
+    ctx = MagicMock()
+    ctx.invocation_state = {"application_date": application_date}
+    return ctx
+
+
+class TestCheckTransportationExpenseRules:
+    """check_transportation_expense_rules関数のテスト（承認閾値10,000円・期限3ヶ月）"""
+
+    def _call(self, items, app_date="2026-05-23"):
+        # ツール関数を直接呼び出す（@toolデコレータをバイパス）
+        return rct.check_transportation_expense_rules.__wrapped__(
+            items=items,
+            tool_context=_make_tool_context(app_date),
+        )
+
+    def test_total_and_no_approval(self):
+        result = self._call([
+            {"date": "2026-05-20", "amount": 200},
+            {"date": "2026-05-21", "amount": "1,500円"},
+        ])
+        assert result["success"] is True
+        assert result["total_amount"] == 1700
+        assert result["needs_approval"] is False
+        assert result["expired_dates"] == []
+
+    def test_over_threshold_needs_approval(self):
+        result = self._call([
+            {"date": "2026-05-20", "amount": 6000},
+            {"date": "2026-05-21", "amount": 5000},
+        ])
+        assert result["needs_approval"] is True
+
+    def test_threshold_amount_does_not_need_approval(self):
+        result = self._call([{"date": "2026-05-20", "amount": 10000}])
+        assert result["needs_approval"] is False
+
+    def test_expired_dates_listed(self):
+        result = self._call([
+            {"date": "2026-02-22", "amount": 200},
+            {"date": "2026-02-23", "amount": 200},
+        ])
+        assert result["expired_dates"] == ["2026-02-22"]
+
+    def test_slash_date_normalized(self):
+        result = self._call([{"date": "2026/01/10", "amount": 200}])
+        assert result["expired_dates"] == ["2026-01-10"]
+
+    def test_missing_amount_returns_error(self):
+        result = self._call([{"date": "2026-05-20"}])
+        assert result["success"] is False
+        assert isinstance(result["error_message"], str)
+
+    def test_empty_items_returns_error(self):
+        result = self._call([])
+        assert result["success"] is False
+
+    def test_non_dict_item_returns_error(self):
+        result = self._call([1])
+        assert result["success"] is False
+        assert isinstance(result["error_message"], str)
+
+    def test_missing_application_date_returns_error(self):
+        result = self._call([{"date": "2026-05-20", "amount": 200}], app_date=None)
+        assert result["success"] is False
+        assert result["expired_dates"] is None
+
+
+class TestCheckGeneralExpenseRules:
+    """check_general_expense_rules関数のテスト（承認閾値5,000円）"""
+
+    def test_over_threshold_needs_approval(self):
+        result = rct.check_general_expense_rules.__wrapped__(
+            items=[{"date": "2026-05-20", "amount": 5001}],
+            tool_context=_make_tool_context(),
+        )
+        assert result["total_amount"] == 5001
+        assert result["needs_approval"] is True
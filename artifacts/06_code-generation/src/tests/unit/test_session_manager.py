@@ -11,7 +11,7 @@ class TestSessionManagerFactory:
 
     def test_generate_session_id_format(self):
         session_id = SessionManagerFactory.generate_session_id()
-        assert re.match(r"^session_\d{8}_\d{6}_[0-9a-f]{8}$", session_id)
+        assert re.match(r"^session_[0-9a-f]{32}$", session_id)
 
     def test_generate_session_id_unique(self):
         id1 = SessionManagerFactory.generate_session_id()
@@ -11,6 +11,12 @@ class TestSettings:
     def test_orchestrator_max_iterations(self):
         assert settings.orchestrator.max_iterations == 10
 
+    def test_orchestrator_parallel_tool_execution(self):
+        assert settings.orchestrator.parallel_tool_execution is True
+
+    def test_orchestrator_stream_response(self):
+        assert settings.orchestrator.stream_response is True
+
     def test_transportation_expense_deadline_months(self):
         assert settings.transportation_expense.deadline_months == 3
 
@@ -28,3 +34,7 @@ class TestSettings:
 
     def test_general_expense_approval_threshold(self):
         assert settings.general_expense.approval_threshold == 5000
+
+    def test_specialist_history_char_budget(self):
+        assert settings.transportation_expense.history_char_budget == 8000
+        assert settings.general_expense.history_char_budget == 8000
@@ -1,6 +1,7 @@
 """交通費計算ツールの単体テスト"""
 import json
 import os
+import threading
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -15,7 +16,7 @@ def _make_tool_context(application_date="2026-05-23"):
 
 def _reset_cache():
     """テスト間でキャッシュをリセット"""
-    tt._train_fares = []
+    tt._train_fares = {}
     tt._train_fares_loaded = False
     tt._fixed_fares = {}
     tt._fixed_fares_loaded = False
@@ -55,6 +56,38 @@ class TestLoadTrainFares:
                 ok, err = tt._load_train_fares()
         assert ok is True
 
+    def test_duplicate_route_keeps_first_fare(self, tmp_path):
+        data = {"routes": [
+            {"departure": "東京", "destination": "新宿", "fare": 200},
+            {"departure": "東京", "destination": "新宿", "fare": 999},
+        ]}
+        fares_file = tmp_path / "train_fares.json"
+        fares_file.write_text(json.dumps(data), encoding="utf-8")
+
+        with patch.object(tt, "_TRAIN_FARES_PATH", str(fares_file)):
+            tt._load_train_fares()
+        assert tt._train_fares == {("東京", "新宿"): 200}
+
+    def test_concurrent_calls_load_once(self, tmp_path):
+        data = {"routes": [{"departure": "東京", "destination": "新宿", "fare": 200}]}
+        fares_file = tmp_path / "train_fares.json"
+        fares_file.write_text(json.dumps(data), encoding="utf-8")
+
+        barrier = threading.Barrier(8)
+
+        def load():
+            barrier.wait()
+            tt._load_train_fares()
+
+        with patch.object(tt, "_TRAIN_FARES_PATH", str(fares_file)):
+            with patch.object(tt.json, "load", wraps=json.load) as mock_load:
+                threads = [threading.Thread(target=load) for _ in range(8)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+        mock_load.assert_called_once()
+
 
 class TestCalculateTransportationCost:
     """calculate_transportation_cost関数のテスト"""
@@ -171,3 +204,63 @@ class TestCalculateTransportationCost:
             tool_context=ctx,
         )
         assert result["success"] is False
+
+
+class TestCalculateTransportationCosts:
+    """calculate_transportation_costs関数のテスト"""
+
+    def setup_method(self):
+        _reset_cache()
+
+    def teardown_method(self):
+        _reset_cache()
+
+    def test_results_in_input_order(self, tmp_path):
+        data = {"routes": [
+            {"departure": "東京", "destination": "新宿", "fare": 200},
+            {"departure": "新宿", "destination": "東京", "fare": 200},
+        ]}
+        fares_file = tmp_path / "train_fares.json"
+        fares_file.write_text(json.dumps(data), encoding="utf-8")
+
+        segments = [
+            {"departure": "東京", "destination": "新宿", "transport_type": "電車", "travel_date": "2026-05-20"},
+            {"departure": "大阪", "destination": "京都", "transport_type": "電車", "travel_date": "2026-05-20"},
+            {"departure": "新宿", "destination": "東京", "transport_type": "電車", "travel_date": "2026-01-10"},
+        ]
+        with patch.object(tt, "_TRAIN_FARES_PATH", str(fares_file)):
+            result = tt.calculate_transportation_costs.__wrapped__(
+                segments=segments, tool_context=_make_tool_context(),
+            )
+
+        results = result["results"]
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[0]["fare"] == 200
+        assert results[2]["is_expired"] is True
+
+    def test_invalid_segment_returns_error_result(self):
+        result = tt.calculate_transportation_costs.__wrapped__(
+            segments=["不正な区間"], tool_context=_make_tool_context(),
+        )
+        assert result["results"][0]["success"] is False
+
+    def test_empty_segments(self):
+        result = tt.calculate_transportation_costs.__wrapped__(
+            segments=[], tool_context=_make_tool_context(),
+        )
+        assert result == {"results": []}
+
+
+class TestPreloadFareData:
+    """preload_fare_data関数のテスト"""
+
+    def setup_method(self):
+        _reset_cache()
+
+    def teardown_method(self):
+        _reset_cache()
+
+    def test_loads_both_fare_tables(self):
+        tt.preload_fare_data()
+        assert tt._train_fares_loaded is True
+        assert tt._fixed_fares_loaded is True
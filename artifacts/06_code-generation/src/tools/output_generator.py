@@ -5,11 +5,11 @@
 import logging
 import os
 from datetime import datetime
+from io import BytesIO
 from typing import Callable
 from uuid import uuid4
 
-from openpyxl import load_workbook
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 from strands import tool, ToolContext
 
 from handlers.error_handler import ErrorHandler
@@ -21,9 +21,17 @@ _logger = logging.getLogger(__name__)
 _TRANSPORTATION_EXPENSE_TEMPLATE = "template/交通費精算申請書テンプレート.xlsx"
 _GENERAL_EXPENSE_TEMPLATE = "template/経費精算申請書テンプレート.xlsx"
 
+# ユーザー向けエラーメッセージ
+_TEMPLATE_NOT_FOUND_MESSAGE = "申請書テンプレートが見つかりません。システム管理者にお問い合わせください。"
+_APPLICANT_INFO_MISSING_MESSAGE = "申請者情報の取得に失敗しました。再度お試しください。"
+
 # Excel 数式インジェクション対策: =, +, -, @ で始まる文字列はセル数式として解釈される
 _FORMULA_CHARS = frozenset(("=", "+", "-", "@"))
 
+# テンプレートファイルの内容キャッシュ
+# キー: テンプレートパス、値: ((更新時刻ns, サイズ), ファイル内容)
+_template_cache: dict[str, tuple[tuple[int, int], bytes]] = {}
+
 
 def _sanitize_cell(value: object) -> object:
     """Excel 数式インジェクションを防ぐため、数式トリガー文字で始まる文字列に
@@ -34,6 +42,30 @@ def _sanitize_cell(value: object) -> object:
     return value
 
 
+def _read_template(template_path: str) -> bytes:
+    """テンプレートファイルの内容を返す。
+
+    申請書の生成（修正後の再生成を含む）のたびに同じテンプレートを読み込むため、
+    内容をメモリに保持する。ファイルの更新時刻・サイズが変わった場合は読み直す。
+
+    Args:
+        template_path: テンプレートファイルのパス
+
+    Returns:
+        bytes: テンプレートファイルの内容
+    """
+    stat = os.stat(template_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _template_cache.get(template_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(template_path, "rb") as f:
+        content = f.read()
+    _template_cache[template_path] = (signature, content)
+    return content
+
+
 def _generate_form(
     template_path: str,
     applicant_name: str,
@@ -67,11 +99,15 @@ def _generate_form(
         return {
             "success": False,
             "file_path": None,
-            "error_message": "申請書テンプレートが見つかりません。システム管理者にお問い合わせください。",
+            "error_message": _TEMPLATE_NOT_FOUND_MESSAGE,
         }
 
     try:
-        wb = load_workbook(template_path)
+        # openpyxl は読み込みに時間がかかるため、申請書を初めて生成するときまでインポートを遅延させる
+        from openpyxl import load_workbook
+
+        # 書き込みで変更されるため、ワークブックは毎回キャッシュ済みの内容から生成する
+        wb = load_workbook(BytesIO(_read_template(template_path)))
         ws = wb.active
 
         # ヘッダー書き込み
@@ -138,61 +174,108 @@ def _write_general_expense_rows(ws, items: list) -> None:
         ws.cell(row=row, column=7, value=_sanitize_cell(item.get("purpose", "")))
 
 
-@tool(context=True)
-def generate_transportation_expense_form(items: list, tool_context: ToolContext) -> dict:
-    """交通費精算申請書を生成する。
-
-    区間情報リストをExcelテンプレートに埋め込み、申請書ファイルを出力する。
+def _generate_form_from_tool(
+    items: list,
+    tool_context: ToolContext,
+    input_model: type[BaseModel],
+    template_path: str,
+    write_detail_rows: Callable,
+    form_name: str,
+) -> dict:
+    """申請書生成ツールの共通処理（申請者情報取得 → バリデーション → 生成）。
 
     Args:
-        items: 区間情報リスト。各要素は以下のフィールドを持つ辞書:
-            - travel_date (str): 移動日（YYYY-MM-DD）【必須】
-            - departure (str): 出発地【必須】
-            - destination (str): 目的地【必須】
-            - transport_type (str): 交通手段【必須】
-            - amount (int): 金額（円）【必須】
-            - purpose (str): 業務目的【必須】
+        items: 明細リスト
+        tool_context: Strands SDK が注入する ToolContext
+        input_model: 明細リストのバリデーションに使用する入力モデル
+        template_path: テンプレートファイルのパス
+        write_detail_rows: 明細行書き込み関数
+        form_name: 申請書名（ログ表示・出力ファイル名のプレフィックス）
 
     Returns:
-        dict: {"success": bool, "file_path": Optional[str], "error_message": Optional[str]}
+        dict: {
+            "success": bool,
+            "file_path": Optional[str],
+            "total_amount": Optional[int],
+            "error_message": Optional[str]
+        }
     """
-    applicant_name = tool_context.invocation_state.get("applicant_name")
-    application_date = tool_context.invocation_state.get("application_date")
+    state = getattr(tool_context, "invocation_state", None) or {}
+    applicant_name = state.get("applicant_name")
+    application_date = state.get("application_date")
 
     if not applicant_name or not application_date:
         return {
             "success": False,
             "file_path": None,
-            "error_message": "申請者情報の取得に失敗しました。再度お試しください。",
+            "total_amount": None,
+            "error_message": _APPLICANT_INFO_MISSING_MESSAGE,
         }
 
-    _logger.info("交通費精算申請書生成開始: 申請者=%s, 明細件数=%d", applicant_name, len(items))
+    _logger.info("%s生成開始: 申請者=%s, 明細件数=%d", form_name, applicant_name, len(items))
 
     try:
-        validated = TransportationExpenseFormInput(items=items)
+        validated = input_model(items=items)
     except ValidationError as e:
         _logger.error("入力バリデーションエラー", exc_info=True)
         return {
             "success": False,
             "file_path": None,
+            "total_amount": None,
             "error_message": ErrorHandler.handle_validation_error(e),
         }
 
     result = _generate_form(
-        template_path=_TRANSPORTATION_EXPENSE_TEMPLATE,
+        template_path=template_path,
         applicant_name=applicant_name,
         application_date=application_date,
         validated=validated,
-        write_detail_rows=_write_transportation_expense_rows,
-        output_filename_prefix="交通費精算申請書",
+        write_detail_rows=write_detail_rows,
+        output_filename_prefix=form_name,
     )
 
+    # 合計金額はモデルに加算させず、検証済みの明細から算出して返す
+    result["total_amount"] = None
     if result["success"]:
-        _logger.info("交通費精算申請書生成完了: %s", result["file_path"])
+        result["total_amount"] = sum(item["amount"] for item in validated.items)
+        _logger.info("%s生成完了: %s", form_name, result["file_path"])
 
     return result
 
 
+@tool(context=True)
+def generate_transportation_expense_form(items: list, tool_context: ToolContext) -> dict:
+    """交通費精算申請書を生成する。
+
+    区間情報リストをExcelテンプレートに埋め込み、申請書ファイルを出力する。
+
+    Args:
+        items: 区間情報リスト。各要素は以下のフィールドを持つ辞書:
+            - travel_date (str): 移動日（YYYY-MM-DD）【必須】
+            - departure (str): 出発地【必須】
+            - destination (str): 目的地【必須】
+            - transport_type (str): 交通手段【必須】
+            - amount (int): 金額（円）【必須】
+            - purpose (str): 業務目的【必須】
+
+    Returns:
+        dict: {
+            "success": bool,
+            "file_path": Optional[str],
+            "total_amount": Optional[int],
+            "error_message": Optional[str]
+        }
+    """
+    return _generate_form_from_tool(
+        items=items,
+        tool_context=tool_context,
+        input_model=TransportationExpenseFormInput,
+        template_path=_TRANSPORTATION_EXPENSE_TEMPLATE,
+        write_detail_rows=_write_transportation_expense_rows,
+        form_name="交通費精算申請書",
+    )
+
+
 @tool(context=True)
 def generate_general_expense_form(items: list, tool_context: ToolContext) -> dict:
     """経費精算申請書を生成する。
@@ -209,40 +292,18 @@ def generate_general_expense_form(items: list, tool_context: ToolContext) -> dic
             - purpose (str): 業務目的【必須】
 
     Returns:
-        dict: {"success": bool, "file_path": Optional[str], "error_message": Optional[str]}
-    """
-    applicant_name = tool_context.invocation_state.get("applicant_name")
-    application_date = tool_context.invocation_state.get("application_date")
-
-    if not applicant_name or not application_date:
-        return {
-            "success": False,
-            "file_path": None,
-            "error_message": "申請者情報の取得に失敗しました。再度お試しください。",
-        }
-
-    _logger.info("経費精算申請書生成開始: 申請者=%s, 明細件数=%d", applicant_name, len(items))
-
-    try:
-        validated = GeneralExpenseFormInput(items=items)
-    except ValidationError as e:
-        _logger.error("入力バリデーションエラー", exc_info=True)
-        return {
-            "success": False,
-            "file_path": None,
-            "error_message": ErrorHandler.handle_validation_error(e),
+        dict: {
+            "success": bool,
+            "file_path": Optional[str],
+            "total_amount": Optional[int],
+            "error_message": Optional[str]
         }
-
-    result = _generate_form(
+    """
+    return _generate_form_from_tool(
+        items=items,
+        tool_context=tool_context,
+        input_model=GeneralExpenseFormInput,
         template_path=_GENERAL_EXPENSE_TEMPLATE,
-        applicant_name=applicant_name,
-        application_date=application_date,
-        validated=validated,
         write_detail_rows=_write_general_expense_rows,
-        output_filename_prefix="経費精算申請書",
+        form_name="経費精算申請書",
     )
-
-    if result["success"]:
-        _logger.info("経費精算申請書生成完了: %s", result["file_path"])
-
-    return result
@@ -0,0 +1,134 @@
+"""申請ルールチェックツール
+
+明細の合計金額・上長承認要否・申請期限超過を計算で判定する。
+金額閾値・期限の判定をモデルの推論に委ねず、ツールの結果（真偽値）で分岐させる。
+"""
+import logging
+
+from pydantic import ValidationError
+from strands import tool, ToolContext
+
+from config.settings import settings
+from handlers.error_handler import ErrorHandler
+from models.data_models import RuleCheckInput, calculate_deadline_date
+
+_logger = logging.getLogger(__name__)
+
+_APPLICATION_DATE_MISSING_MESSAGE = "申請日の取得に失敗しました。再度お試しください。"
+
+
+def _check_application_rules(
+    items: list,
+    tool_context: ToolContext,
+    deadline_months: int,
+    approval_threshold: int,
+) -> dict:
+    """明細の合計金額・上長承認要否・申請期限超過を判定する。
+
+    Args:
+        items: 明細リスト（各要素は date, amount を含む辞書）
+        tool_context: Strands SDK が注入する ToolContext
+        deadline_months: 申請期限の月数（経費発生日からの期間）
+        approval_threshold: 上長承認が必要となる金額閾値（円）
+
+    Returns:
+        dict: {
+            "success": bool,
+            "total_amount": Optional[int],
+            "needs_approval": Optional[bool],
+            "expired_dates": Optional[list[str]],
+            "error_message": Optional[str]
+        }
+    """
+    try:
+        validated = RuleCheckInput(items=items)
+    except ValidationError as e:
+        _logger.error("入力バリデーションエラー", exc_info=True)
+        return {
+            "success": False,
+            "total_amount": None,
+            "needs_approval": None,
+            "expired_dates": None,
+            "error_message": ErrorHandler.handle_validation_error(e),
+        }
+
+    state = getattr(tool_context, "invocation_state", None) or {}
+    application_date = state.get("application_date")
+    try:
+        if not application_date:
+            raise ValueError("application_date is missing")
+        deadline_iso = calculate_deadline_date(application_date, deadline_months)
+    except ValueError:
+        _logger.error("申請日が取得できないため申請ルールを判定できません: application_date=%r", application_date)
+        return {
+            "success": False,
+            "total_amount": None,
+            "needs_approval": None,
+            "expired_dates": None,
+            "error_message": _APPLICATION_DATE_MISSING_MESSAGE,
+        }
+
+    total_amount = sum(item["amount"] for item in validated.items)
+    # YYYY-MM-DD 形式の文字列は辞書順と日付順が一致する
+    expired_dates = [item["date"] for item in validated.items if item["date"] < deadline_iso]
+    needs_approval = total_amount > approval_threshold
+
+    _logger.info(
+        "申請ルールチェック完了: 件数=%d, 合計=%d円, 上長承認=%s, 期限超過=%d件",
+        len(validated.items), total_amount, needs_approval, len(expired_dates),
+    )
+    return {
+        "success": True,
+        "total_amount": total_amount,
+        "needs_approval": needs_approval,
+        "expired_dates": expired_dates,
+        "error_message": None,
+    }
+
+
+@tool(context=True)
+def check_transportation_expense_rules(items: list, tool_context: ToolContext) -> dict:
+    """交通費明細の合計金額・上長承認要否・申請期限超過を判定する。
+
+    Args:
+        items: 明細リスト。各要素は以下のキーを持つ辞書:
+            - date: 利用日（YYYY-MM-DD形式）
+            - amount: 金額（円）
+
+    Returns:
+        dict: {
+            "success": bool,
+            "total_amount": Optional[int],
+            "needs_approval": Optional[bool],
+            "expired_dates": Optional[list[str]],
+            "error_message": Optional[str]
+        }
+    """
+    cfg = settings.transportation_expense
+    return _check_application_rules(
+        items, tool_context, cfg.deadline_months, cfg.approval_threshold
+    )
+
+
+@tool(context=True)
+def check_general_expense_rules(items: list, tool_context: ToolContext) -> dict:
+    """経費明細の合計金額・上長承認要否・申請期限超過を判定する。
+
+    Args:
+        items: 明細リスト。各要素は以下のキーを持つ辞書:
+            - date: 購入日・利用日（YYYY-MM-DD形式）
+            - amount: 金額（円）
+
+    Returns:
+        dict: {
+            "success": bool,
+            "total_amount": Optional[int],
+            "needs_approval": Optional[bool],
+            "expired_dates": Optional[list[str]],
+            "error_message": Optional[str]
+        }
+    """
+    cfg = settings.general_expense
+    return _check_application_rules(
+        items, tool_context, cfg.deadline_months, cfg.approval_threshold
+    )
@@ -5,14 +5,14 @@
 import json
 import logging
 import os
+import threading
+from typing import Optional
 
-from dateutil.relativedelta import relativedelta
-from datetime import datetime
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from strands import tool, ToolContext
 
 from handlers.error_handler import ErrorHandler
-from models.data_models import RouteData, TransportCalculatorInput
+from models.data_models import RouteData, TransportCalculatorInput, calculate_deadline_date
 from config.settings import settings
 
 _logger = logging.getLogger(__name__)
@@ -22,12 +22,22 @@ _TRAIN_FARES_PATH = "data/train_fares.json"
 _FIXED_FARES_PATH = "data/fixed_fares.json"
 
 # キャッシュ変数（R9.12.4準拠: 空コンテナ判定禁止）
-_train_fares: list = []
+# 電車運賃は (出発地, 目的地) → 運賃 の辞書で保持し、経路検索を1回の参照で行う
+_train_fares: dict[tuple[str, str], int] = {}
 _train_fares_loaded: bool = False
 
 _fixed_fares: dict = {}
 _fixed_fares_loaded: bool = False
 
+# 運賃データ全件を1回の呼び出しで検証するアダプター
+_ROUTES_ADAPTER = TypeAdapter(list[RouteData])
+
+# 固定運賃が未登録の交通手段に対するエラーメッセージ
+_UNKNOWN_TRANSPORT_TYPE_MESSAGE = "交通手段未登録のため自動計算不可。ユーザーに金額確認を依頼"
+
+# 事前読み込みスレッドとツール呼び出しが同時に読み込まないよう、読み込み処理を直列化する
+_fare_load_lock = threading.Lock()
+
 # 固定運賃データの英語キー→日本語交通手段マッピング
 _TRANSPORT_TYPE_TO_KEY = {
     "バス": "bus",
@@ -47,27 +57,32 @@ def _load_train_fares() -> tuple[bool, str]:
     if _train_fares_loaded:
         return (True, "")
 
-    if not os.path.exists(_TRAIN_FARES_PATH):
-        _logger.warning("運賃データファイルが見つかりません: %s", _TRAIN_FARES_PATH)
-        return (False, ErrorHandler.handle_fare_data_error(FileNotFoundError(_TRAIN_FARES_PATH)))
+    with _fare_load_lock:
+        if _train_fares_loaded:
+            return (True, "")
 
-    try:
-        with open(_TRAIN_FARES_PATH, encoding="utf-8") as f:
-            data = json.load(f)
-
-        # train_fares.jsonは {"routes": [...]} 形式
-        routes = data.get("routes", data) if isinstance(data, dict) else data
-
-        validated = []
-        for item in routes:
-            validated.append(RouteData(**item))
-        _train_fares = validated
-        _train_fares_loaded = True
-        _logger.info("電車運賃データを読み込みました: %d件", len(_train_fares))
-        return (True, "")
-    except Exception as e:
-        _logger.error("運賃データ読み込みエラー: %s", _TRAIN_FARES_PATH, exc_info=True)
-        return (False, ErrorHandler.handle_fare_data_error(e))
+        if not os.path.exists(_TRAIN_FARES_PATH):
+            _logger.warning("運賃データファイルが見つかりません: %s", _TRAIN_FARES_PATH)
+            return (False, ErrorHandler.handle_fare_data_error(FileNotFoundError(_TRAIN_FARES_PATH)))
+
+        try:
+            with open(_TRAIN_FARES_PATH, encoding="utf-8") as f:
+                data = json.load(f)
+
+            # train_fares.jsonは {"routes": [...]} 形式
+            routes = data.get("routes", data) if isinstance(data, dict) else data
+
+            fares: dict[tuple[str, str], int] = {}
+            for route in _ROUTES_ADAPTER.validate_python(routes):
+                # 同一経路が重複登録されている場合は先に登録された運賃を優先する
+                fares.setdefault((route.departure, route.destination), route.fare)
+            _train_fares = fares
+            _train_fares_loaded = True
+            _logger.info("電車運賃データを読み込みました: %d件", len(_train_fares))
+            return (True, "")
+        except Exception as e:
+            _logger.error("運賃データ読み込みエラー: %s", _TRAIN_FARES_PATH, exc_info=True)
+            return (False, ErrorHandler.handle_fare_data_error(e))
 
 
 def _load_fixed_fares() -> tuple[bool, str]:
@@ -81,48 +96,56 @@ def _load_fixed_fares() -> tuple[bool, str]:
     if _fixed_fares_loaded:
         return (True, "")
 
-    if not os.path.exists(_FIXED_FARES_PATH):
-        _logger.warning("固定運賃データファイルが見つかりません: %s", _FIXED_FARES_PATH)
-        return (False, ErrorHandler.handle_fare_data_error(FileNotFoundError(_FIXED_FARES_PATH)))
+    with _fare_load_lock:
+        if _fixed_fares_loaded:
+            return (True, "")
 
-    try:
-        with open(_FIXED_FARES_PATH, encoding="utf-8") as f:
-            data = json.load(f)
+        if not os.path.exists(_FIXED_FARES_PATH):
+            _logger.warning("固定運賃データファイルが見つかりません: %s", _FIXED_FARES_PATH)
+            return (False, ErrorHandler.handle_fare_data_error(FileNotFoundError(_FIXED_FARES_PATH)))
 
-        _fixed_fares = data
-        _fixed_fares_loaded = True
-        _logger.info("固定運賃データを読み込みました: %d件", len(_fixed_fares))
-        return (True, "")
-    except Exception as e:
-        _logger.error("固定運賃データ読み込みエラー: %s", _FIXED_FARES_PATH, exc_info=True)
-        return (False, ErrorHandler.handle_fare_data_error(e))
+        try:
+            with open(_FIXED_FARES_PATH, encoding="utf-8") as f:
+                data = json.load(f)
 
+            _fixed_fares = data
+            _fixed_fares_loaded = True
+            _logger.info("固定運賃データを読み込みました: %d件", len(_fixed_fares))
+            return (True, "")
+        except Exception as e:
+            _logger.error("固定運賃データ読み込みエラー: %s", _FIXED_FARES_PATH, exc_info=True)
+            return (False, ErrorHandler.handle_fare_data_error(e))
 
-@tool(context=True)
-def calculate_transportation_cost(
+
+def preload_fare_data() -> None:
+    """電車運賃・固定運賃データを事前に読み込む。
+
+    初回のツール呼び出し時の読み込み待ちをなくすため、ユーザー入力待ちの間に
+    バックグラウンドで呼び出すことを想定する。読み込み失敗時はログのみ出力し、
+    ツール呼び出し時に改めて読み込みとエラー応答が行われる。
+    """
+    _load_train_fares()
+    _load_fixed_fares()
+
+
+def _calculate_fare(
     departure: str,
     destination: str,
     transport_type: str,
     travel_date: str,
-    tool_context: ToolContext,
+    application_date: Optional[str],
 ) -> dict:
-    """出発地・目的地・交通手段・移動日に基づいて交通費を自動計算する。
-
-    電車の場合は経路テーブルから運賃を検索し、バス・タクシー・飛行機の場合は固定運賃を返却する。
+    """1区間の交通費を計算する。
 
     Args:
         departure: 出発地（駅名・場所名）
         destination: 目的地（駅名・場所名）
         transport_type: 交通手段（電車/バス/タクシー/飛行機）
         travel_date: 移動日（YYYY-MM-DD形式）
+        application_date: 申請日（YYYY-MM-DD形式）。Noneの場合は期限チェックを行わない
 
     Returns:
-        dict: {
-            "success": bool,
-            "fare": Optional[int],
-            "error_message": Optional[str],
-            "is_expired": Optional[bool]
-        }
+        dict: calculate_transportation_cost と同じ形式の計算結果
     """
     _logger.info(
         "交通費計算開始: 出発地=%s, 目的地=%s, 交通手段=%s",
@@ -147,21 +170,20 @@ def calculate_transportation_cost(
         }
 
     # 申請期限チェック
-    application_date = tool_context.invocation_state.get("application_date")
     is_expired = False
     if application_date:
         try:
-            app_dt = datetime.strptime(application_date, "%Y-%m-%d")
-            travel_dt = datetime.strptime(validated.travel_date, "%Y-%m-%d")
-            deadline_months = settings.transportation_expense.deadline_months
-            deadline_dt = app_dt - relativedelta(months=deadline_months)
-            if travel_dt < deadline_dt:
+            deadline = calculate_deadline_date(
+                application_date, settings.transportation_expense.deadline_months
+            )
+            # YYYY-MM-DD 形式の文字列は辞書順と日付順が一致する
+            if validated.travel_date < deadline:
                 is_expired = True
                 _logger.warning(
                     "申請期限超過: 移動日=%s, 申請日=%s",
                     validated.travel_date, application_date,
                 )
-        except Exception:
+        except ValueError:
             pass
 
     # 交通手段による分岐
@@ -171,11 +193,7 @@ def calculate_transportation_cost(
             if not ok:
                 return {"success": False, "fare": None, "error_message": err, "is_expired": None}
 
-            fare = None
-            for route in _train_fares:
-                if route.departure == validated.departure and route.destination == validated.destination:
-                    fare = route.fare
-                    break
+            fare = _train_fares.get((validated.departure, validated.destination))
 
             if fare is None:
                 _logger.info(
@@ -203,7 +221,7 @@ def calculate_transportation_cost(
                 return {
                     "success": False,
                     "fare": None,
-                    "error_message": "交通手段未登録のため自動計算不可。ユーザーに金額確認を依頼",
+                    "error_message": _UNKNOWN_TRANSPORT_TYPE_MESSAGE,
                     "is_expired": is_expired,
                 }
             fare = _fixed_fares[fare_key]
@@ -219,3 +237,71 @@ def calculate_transportation_cost(
             "error_message": ErrorHandler.handle_calculation_error(e),
             "is_expired": None,
         }
+
+
+@tool(context=True)
+def calculate_transportation_cost(
+    departure: str,
+    destination: str,
+    transport_type: str,
+    travel_date: str,
+    tool_context: ToolContext,
+) -> dict:
+    """出発地・目的地・交通手段・移動日に基づいて交通費を自動計算する。
+
+    電車の場合は経路テーブルから運賃を検索し、バス・タクシー・飛行機の場合は固定運賃を返却する。
+
+    Args:
+        departure: 出発地（駅名・場所名）
+        destination: 目的地（駅名・場所名）
+        transport_type: 交通手段（電車/バス/タクシー/飛行機）
+        travel_date: 移動日（YYYY-MM-DD形式）
+
+    Returns:
+        dict: {
+            "success": bool,
+            "fare": Optional[int],
+            "error_message": Optional[str],
+            "is_expired": Optional[bool]
+        }
+    """
+    state = getattr(tool_context, "invocation_state", None) or {}
+    return _calculate_fare(
+        departure, destination, transport_type, travel_date, state.get("application_date")
+    )
+
+
+@tool(context=True)
+def calculate_transportation_costs(segments: list, tool_context: ToolContext) -> dict:
+    """複数区間の交通費を1回の呼び出しでまとめて計算する。
+
+    各区間の計算結果は calculate_transportation_cost と同じ形式で、入力と同じ順序で返却する。
+
+    Args:
+        segments: 区間リスト。各要素は以下のキーを持つ辞書:
+            - departure: 出発地（駅名・場所名）
+            - destination: 目的地（駅名・場所名）
+            - transport_type: 交通手段（電車/バス/タクシー/飛行機）
+            - travel_date: 移動日（YYYY-MM-DD形式）
+
+    Returns:
+        dict: {
+            "results": list[dict]
+        }
+    """
+    state = getattr(tool_context, "invocation_state", None) or {}
+    application_date = state.get("application_date")
+    results = []
+    for segment in segments:
+        segment = segment if isinstance(segment, dict) else {}
+        results.append(
+            _calculate_fare(
+                segment.get("departure", ""),
+                segment.get("destination", ""),
+                segment.get("transport_type", ""),
+                segment.get("travel_date", ""),
+                application_date,
+            )
+        )
+    _logger.info("交通費一括計算完了: %d区間", len(results))
+    return {"results": results}